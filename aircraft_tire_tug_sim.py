@@ -18,6 +18,10 @@ Physics:
 import pygame
 import math
 import sys
+import functools
+from enum import IntEnum
+
+import numpy as np
 
 # ==============================================================================
 # CONFIGURATION
@@ -27,37 +31,69 @@ WINDOW_WIDTH = 1700
 WINDOW_HEIGHT = 900
 FPS = 60
 
-# Colors
-COLORS = {
-    'bg': (15, 15, 22),
-    'bg_panel': (25, 28, 35),
-    'bg_selected': (40, 55, 70),
-    'grid': (50, 50, 65),
-    'text': (240, 240, 245),
-    'text_dim': (130, 135, 150),
-    'text_highlight': (255, 220, 100),
-    'f_handle': (255, 90, 90),
-    'f_pull': (90, 255, 140),
-    'f_ground': (255, 180, 90),
-    'moment_arm': (90, 175, 255),
-    'left_arm': (160, 160, 175),
-    'right_arm': (200, 165, 105),
-    'pivot': (255, 195, 95),
-    'tire': (60, 60, 70),
-    'tire_rim': (120, 120, 130),
-    'aircraft': (100, 150, 200),
-    'button_active': (70, 180, 120),
-    'button_inactive': (50, 55, 65),
-    'button_hover': (80, 90, 100),
-    'slider_bg': (40, 45, 55),
-    'slider_fill': (80, 160, 120),
-    'slider_knob': (220, 225, 235),
-    'angle_indicator': (255, 100, 100),
-    'motor_specs': (180, 140, 255),
-    'warning': (255, 100, 100),
-    'good': (100, 255, 140),
-    'selection_border': (100, 200, 255),
-}
+# Colors - palette indexed by IntEnum so color lookups are constant-time
+# array accesses instead of string-hashed dict probes
+class C(IntEnum):
+    bg = 0
+    bg_panel = 1
+    bg_selected = 2
+    grid = 3
+    text = 4
+    text_dim = 5
+    text_highlight = 6
+    f_handle = 7
+    f_pull = 8
+    f_ground = 9
+    moment_arm = 10
+    left_arm = 11
+    right_arm = 12
+    pivot = 13
+    tire = 14
+    tire_rim = 15
+    aircraft = 16
+    button_active = 17
+    button_inactive = 18
+    button_hover = 19
+    slider_bg = 20
+    slider_fill = 21
+    slider_knob = 22
+    angle_indicator = 23
+    motor_specs = 24
+    warning = 25
+    good = 26
+    selection_border = 27
+
+
+COLOR_TABLE = (
+    (15, 15, 22),  # bg
+    (25, 28, 35),  # bg_panel
+    (40, 55, 70),  # bg_selected
+    (50, 50, 65),  # grid
+    (240, 240, 245),  # text
+    (130, 135, 150),  # text_dim
+    (255, 220, 100),  # text_highlight
+    (255, 90, 90),  # f_handle
+    (90, 255, 140),  # f_pull
+    (255, 180, 90),  # f_ground
+    (90, 175, 255),  # moment_arm
+    (160, 160, 175),  # left_arm
+    (200, 165, 105),  # right_arm
+    (255, 195, 95),  # pivot
+    (60, 60, 70),  # tire
+    (120, 120, 130),  # tire_rim
+    (100, 150, 200),  # aircraft
+    (70, 180, 120),  # button_active
+    (50, 55, 65),  # button_inactive
+    (80, 90, 100),  # button_hover
+    (40, 45, 55),  # slider_bg
+    (80, 160, 120),  # slider_fill
+    (220, 225, 235),  # slider_knob
+    (255, 100, 100),  # angle_indicator
+    (180, 140, 255),  # motor_specs
+    (255, 100, 100),  # warning
+    (100, 255, 140),  # good
+    (100, 200, 255),  # selection_border
+)
 
 # Friction coefficients
 FRICTION_PRESETS = {
@@ -76,21 +112,65 @@ TIRE_RADIUS_FT = (TIRE_DIAMETER_IN / 2) / 12
 DEFAULT_HANDLE_LENGTH = 3.0
 DEFAULT_AIRCRAFT_ARM = 1.5
 GRAY_ARM_ANGLE = 40
+# Trig for the fixed arm angles, computed once: the gold arm's base angle
+# is (180 - 40) - 90 = 50 deg, the gray arm is drawn at 180 - 40 = 140 deg
+_COS_GOLD = math.cos(math.radians((180 - GRAY_ARM_ANGLE) - 90))
+_SIN_GOLD = math.sin(math.radians((180 - GRAY_ARM_ANGLE) - 90))
+_COS_GRAY = math.cos(math.radians(180 - GRAY_ARM_ANGLE))
+_SIN_GRAY = math.sin(math.radians(180 - GRAY_ARM_ANGLE))
+_INV_COS_GRAY = 1.0 / math.cos(math.radians(GRAY_ARM_ANGLE))
 TARGET_SPEED_MPH = 3.0
 TARGET_SPEED_FPS = TARGET_SPEED_MPH * 5280 / 3600
 SCALE = 38
 
+# Motor spec multipliers, folded from torque * omega / 550 (and * 745.7 for
+# watts) so calculate_forces is a couple of multiplies per frame
+_OMEGA = TARGET_SPEED_FPS / TIRE_RADIUS_FT
+_K_HP = TIRE_RADIUS_FT * _OMEGA / 550.0
+_K_W = _K_HP * 745.7
+
 # Layout constants
 LEFT_PANEL_WIDTH = 200
 RIGHT_PANEL_WIDTH = 280
 CENTER_START = LEFT_PANEL_WIDTH + 20
 CENTER_WIDTH = WINDOW_WIDTH - LEFT_PANEL_WIDTH - RIGHT_PANEL_WIDTH - 40
 
+# ==============================================================================
+# TEXT RENDER CACHE
+# ==============================================================================
+
+# font.render is one of the slowest per-frame pygame calls; route text
+# through a global LRU cache so repeated strings become dict lookups
+_FONT_TABLE = {}
+
+
+@functools.lru_cache(maxsize=2048)
+def _render_cached(font_id, text, color):
+    # convert_alpha puts the glyphs in the display format, so every reuse
+    # blits without a per-call pixel conversion
+    return _FONT_TABLE[font_id].render(text, True, color).convert_alpha()
+
+
+def _render_text(font, text, color):
+    font_id = id(font)
+    if font_id not in _FONT_TABLE:
+        _FONT_TABLE[font_id] = font
+    return _render_cached(font_id, text, color)
+
+
+@functools.lru_cache(maxsize=2048)
+def _fmt(value, spec):
+    """Memoized float formatting - repeated values skip __format__."""
+    return format(value, spec)
+
+
 # ==============================================================================
 # UI COMPONENTS
 # ==============================================================================
 
 class Button:
+    __slots__ = ('rect', 'text', 'font', 'active', 'hovered')
+
     def __init__(self, x, y, w, h, text, font, active=False):
         self.rect = pygame.Rect(x, y, w, h)
         self.text = text
@@ -100,26 +180,30 @@ class Button:
     
     def draw(self, surface):
         if self.active:
-            color = COLORS['button_active']
+            color = COLOR_TABLE[C.button_active]
         elif self.hovered:
-            color = COLORS['button_hover']
+            color = COLOR_TABLE[C.button_hover]
         else:
-            color = COLORS['button_inactive']
+            color = COLOR_TABLE[C.button_inactive]
         
         pygame.draw.rect(surface, color, self.rect, border_radius=6)
-        pygame.draw.rect(surface, COLORS['text_dim'], self.rect, 2, border_radius=6)
-        txt = self.font.render(self.text, True, COLORS['text'])
+        pygame.draw.rect(surface, COLOR_TABLE[C.text_dim], self.rect, 2, border_radius=6)
+        txt = _render_text(self.font, self.text, COLOR_TABLE[C.text])
         surface.blit(txt, txt.get_rect(center=self.rect.center))
-    
-    def update(self, pos):
-        self.hovered = self.rect.collidepoint(pos)
-    
+
     def clicked(self, pos, pressed):
         return self.rect.collidepoint(pos) and pressed
 
 
 class Slider:
-    def __init__(self, x, y, width, height, label, min_val, max_val, initial, font, 
+    __slots__ = ('rect', 'label', 'min_val', 'max_val', 'value', 'font',
+                 'dragging', 'knob_radius', '_knob_r2', '_inv_w', '_span',
+                 'unit', 'decimals', 'color', '_label_surf', '_bipolar',
+                 '_center_x', '_val_surf', '_knob_x', '_fill_rect', '_dirty',
+                 '_cache_pos', '_cache_surf',
+                 '_c_track', '_c_knob', '_c_line', '_fill_color')
+
+    def __init__(self, x, y, width, height, label, min_val, max_val, initial, font,
                  unit="", decimals=1, color=None):
         self.rect = pygame.Rect(x, y, width, height)
         self.label = label
@@ -129,87 +213,245 @@ class Slider:
         self.font = font
         self.dragging = False
         self.knob_radius = height // 2 + 4
+        self._knob_r2 = self.knob_radius * self.knob_radius
+        # Constant scale/offset for the drag hot path
+        self._inv_w = 1.0 / width
+        self._span = max_val - min_val
         self.unit = unit
         self.decimals = decimals
-        self.color = color or COLORS['slider_fill']
-    
-    def draw(self, surface):
+        self.color = color or COLOR_TABLE[C.slider_fill]
+
+        # Chrome colors, snapshotted so _rebuild_cache skips the palette
+        # lookups
+        self._c_track = COLOR_TABLE[C.slider_bg]
+        self._c_knob = COLOR_TABLE[C.slider_knob]
+        self._c_line = COLOR_TABLE[C.text_dim]
+        self._fill_color = self.color
+
+        # Cached render state - label never changes, value/knob geometry only
+        # change when the value does, so rebuild them lazily via _dirty
+        self._label_surf = self.font.render(self.label, True, COLOR_TABLE[C.text]).convert_alpha()
+        self._bipolar = self.min_val < 0 and self.max_val > 0
+        if self._bipolar:
+            self._center_x = self.rect.x + self.rect.width * (-self.min_val) / (self.max_val - self.min_val)
+        self._val_surf = None
+        self._knob_x = 0.0
+        self._fill_rect = None
+        self._dirty = True
+
+        # The whole slider (label, track, fill, knob, value) renders into one
+        # cached surface so an unchanged slider is a single blit per frame
+        pad_x = self.knob_radius + 2
+        self._cache_pos = (x - pad_x, y - 22)
+        self._cache_surf = pygame.Surface(
+            (width + 2 * pad_x, height + 22 + 25), pygame.SRCALPHA).convert_alpha()
+
+    def _rebuild_cache(self):
+        """Re-render the slider chrome into its cache surface."""
+        frac = (self.value - self.min_val) / (self.max_val - self.min_val)
+        self._knob_x = self.rect.x + frac * self.rect.width
+
+        if self._bipolar:
+            fill_left = min(self._center_x, self._knob_x)
+            fill_right = max(self._center_x, self._knob_x)
+            self._fill_rect = pygame.Rect(fill_left, self.rect.y, fill_right - fill_left, self.rect.height)
+        else:
+            self._fill_rect = pygame.Rect(self.rect.x, self.rect.y, frac * self.rect.width, self.rect.height)
+
+        if self.decimals == 0:
+            val_str = _fmt(self.value, '.0f')
+        elif self.decimals == 1:
+            val_str = _fmt(self.value, '.1f')
+        else:
+            val_str = _fmt(self.value, '.2f')
+
+        if self._bipolar and self.value > 0:
+            val_str = "+" + val_str
+
+        self._val_surf = _render_text(self.font, f"{val_str} {self.unit}", COLOR_TABLE[C.text])
+
+        ox, oy = self._cache_pos
+        surf = self._cache_surf
+        surf.fill((0, 0, 0, 0))
+        track = self.rect.move(-ox, -oy)
+
         # Label above
-        lbl = self.font.render(self.label, True, COLORS['text'])
-        surface.blit(lbl, (self.rect.x, self.rect.y - 20))
-        
+        surf.blit(self._label_surf, (track.x, track.y - 20))
+
         # Track
-        pygame.draw.rect(surface, COLORS['slider_bg'], self.rect, 
+        pygame.draw.rect(surf, self._c_track, track,
                         border_radius=self.rect.height // 2)
-        
+
         # Fill
-        if self.min_val < 0 and self.max_val > 0:
-            center_x = self.rect.x + self.rect.width * (-self.min_val) / (self.max_val - self.min_val)
-            value_x = self.rect.x + ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
-            fill_left = min(center_x, value_x)
-            fill_right = max(center_x, value_x)
-            fill_rect = pygame.Rect(fill_left, self.rect.y, fill_right - fill_left, self.rect.height)
-            pygame.draw.rect(surface, self.color, fill_rect, border_radius=self.rect.height // 2)
-            pygame.draw.line(surface, COLORS['text_dim'], 
-                           (center_x, self.rect.y - 2), (center_x, self.rect.y + self.rect.height + 2), 2)
-        else:
-            fill_width = ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
-            fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
-            pygame.draw.rect(surface, self.color, fill_rect, border_radius=self.rect.height // 2)
-        
+        pygame.draw.rect(surf, self._fill_color, self._fill_rect.move(-ox, -oy),
+                        border_radius=self.rect.height // 2)
+        if self._bipolar:
+            center_x = self._center_x - ox
+            pygame.draw.line(surf, self._c_line,
+                           (center_x, track.y - 2), (center_x, track.bottom + 2), 2)
+
         # Knob
-        knob_x = self.rect.x + ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
-        knob_y = self.rect.y + self.rect.height // 2
-        pygame.draw.circle(surface, COLORS['slider_knob'], (int(knob_x), int(knob_y)), self.knob_radius)
-        pygame.draw.circle(surface, self.color, (int(knob_x), int(knob_y)), self.knob_radius - 3)
-        
+        knob_x = int(self._knob_x - ox)
+        knob_y = track.y + self.rect.height // 2
+        pygame.draw.circle(surf, self._c_knob, (knob_x, knob_y), self.knob_radius)
+        pygame.draw.circle(surf, self._fill_color, (knob_x, knob_y), self.knob_radius - 3)
+
         # Value
-        if self.decimals == 0:
-            val_str = f"{self.value:.0f}"
-        elif self.decimals == 1:
-            val_str = f"{self.value:.1f}"
-        else:
-            val_str = f"{self.value:.2f}"
-        
-        if self.min_val < 0 and self.max_val > 0 and self.value > 0:
-            val_str = "+" + val_str
-        
-        val_txt = self.font.render(f"{val_str} {self.unit}", True, COLORS['text'])
-        surface.blit(val_txt, (self.rect.x, self.rect.y + self.rect.height + 5))
+        surf.blit(self._val_surf, (track.x, track.bottom + 5))
+
+        self._dirty = False
+
+    def blit_pair(self):
+        """(surface, dest) pair for batching sliders through Surface.blits."""
+        if self._dirty:
+            self._rebuild_cache()
+        return (self._cache_surf, self._cache_pos)
+
+    def draw(self, surface):
+        surface.blit(*self.blit_pair())
     
     def handle_event(self, event):
+        """Process one event; returns True if the value changed."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos) or self._knob_hit(event.pos):
                 self.dragging = True
-                self._update_value(event.pos[0])
+                return self._update_value(event.pos[0])
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             self.dragging = False
         elif event.type == pygame.MOUSEMOTION and self.dragging:
-            self._update_value(event.pos[0])
+            return self._update_value(event.pos[0])
+        return False
     
     def _knob_hit(self, pos):
         knob_x = self.rect.x + ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
         knob_y = self.rect.y + self.rect.height // 2
-        return math.sqrt((pos[0] - knob_x)**2 + (pos[1] - knob_y)**2) <= self.knob_radius
+        # Compare squared distances - no need for the sqrt
+        return (pos[0] - knob_x)**2 + (pos[1] - knob_y)**2 <= self._knob_r2
     
     def _update_value(self, mouse_x):
-        rel_x = max(0, min(self.rect.width, mouse_x - self.rect.x))
-        self.value = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
-    
+        # Inlined clamp + precomputed scale; this runs on every MOUSEMOTION
+        # tick during a drag
+        rel_x = mouse_x - self.rect.x
+        if rel_x < 0:
+            rel_x = 0
+        elif rel_x > self.rect.width:
+            rel_x = self.rect.width
+        value = self.min_val + rel_x * self._inv_w * self._span
+        if value == self.value:
+            return False
+        self.value = value
+        self._dirty = True
+        return True
+
     def get_value(self):
         return self.value
-    
+
     def reset(self, value):
         self.value = max(self.min_val, min(self.max_val, value))
+        self._dirty = True
 
 
 # ==============================================================================
 # LEVER DIAGRAM
 # ==============================================================================
 
+# (gold_angle, has_bend) per diagram type - one lookup instead of the
+# branchy if/elif dispatch
+_TYPE_TABLE = {
+    1: (90 - GRAY_ARM_ANGLE, True),
+    2: (90 - GRAY_ARM_ANGLE, True),
+    3: (0, False),
+    4: (90 - GRAY_ARM_ANGLE, False),
+    5: (90 - GRAY_ARM_ANGLE, False),
+    6: (0, False),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _geom(uses_arm_directly, gray_angle_deg, aircraft_arm, x1_constrained, x1_target):
+    """Pure geometry for a diagram config -> (x1_initial, aircraft_arm).
+
+    Slider-driven updates go through _update_diagrams_all, so this now
+    only runs during diagram construction; the memoization just dedupes
+    the trig across diagrams sharing a config.
+    """
+    if gray_angle_deg == GRAY_ARM_ANGLE:
+        cos_gold = _COS_GOLD
+    else:
+        cos_gold = math.cos(math.radians((180 - gray_angle_deg) - 90))
+
+    if uses_arm_directly:
+        x1_initial = aircraft_arm
+    elif x1_constrained:
+        x1_initial = x1_target if x1_target is not None else 1.5
+        aircraft_arm = x1_initial / cos_gold
+    else:
+        x1_initial = aircraft_arm * cos_gold
+
+    return x1_initial, aircraft_arm
+
+
+# Columns of the shared per-diagram state (SoA layout: one row per diagram,
+# so the geometry and force solves happen as vectorized passes per frame)
+(_COL_X1, _COL_HANDLE, _COL_ARM, _COL_F_PULL, _COL_F_HANDLE,
+ _COL_TORQUE, _COL_HP, _COL_W, _COL_NM, _COL_KGCM,
+ _COL_FH_ARROW, _COL_FP_ARROW) = range(12)
+
+
+def _forces_kernel(s, f_pull):
+    """Pure vector kernel: fill the force/motor columns of a state block.
+
+    F_handle = F_pull * X1 / X (guarded against degenerate handles), then
+    the motor chain via the pre-folded torque/power multipliers.
+    """
+    x1 = s[:, _COL_X1]
+    handle_len = s[:, _COL_HANDLE]
+    f_handle = s[:, _COL_F_HANDLE]
+
+    s[:, _COL_F_PULL] = f_pull
+    valid = handle_len > 0.01
+    np.multiply(x1, f_pull, out=f_handle)
+    np.divide(f_handle, handle_len, out=f_handle, where=valid)
+    f_handle[~valid] = 0.0
+
+    # Motor specs per diagram's handle force
+    # Motor needs to provide equivalent force at the tire
+    fh = s[:, _COL_TORQUE]
+    np.abs(f_handle, out=fh)
+
+    # Arrow lengths for the draw path (clamped growth with force)
+    np.minimum(fh * 0.1, 20.0, out=s[:, _COL_FH_ARROW])
+    s[:, _COL_FH_ARROW] += 30.0
+    s[:, _COL_FP_ARROW] = 25.0 + min(abs(f_pull) / 20.0, 15.0)
+
+    np.multiply(fh, _K_HP, out=s[:, _COL_HP])
+    np.multiply(fh, _K_W, out=s[:, _COL_W])
+    fh *= TIRE_RADIUS_FT
+
+    # Torque unit conversions: 1 lb-ft = 1.35582 Nm, 1 Nm = 10.1972 kg.cm
+    np.multiply(fh, 1.35582, out=s[:, _COL_NM])
+    np.multiply(s[:, _COL_NM], 10.1972, out=s[:, _COL_KGCM])
+
+
 class TugDiagram:
+    # The per-frame numeric fields live in the shared SoA block, so the
+    # slots only hold config, the row index, and the cached render layer
+    __slots__ = ('_idx', 'diagram_type', 'name', 'gray_angle',
+                 'x1_constrained', 'gold_angle', 'has_bend',
+                 '_uses_arm_directly', 'x1_initial', 'panel_rect',
+                 '_static_surf', '_static_size', '_static_sig',
+                 '_static_dirty', '_p1_local', '_p2_local',
+                 '_p1_off', '_gold_off', '_comp_surf', '_comp_sig')
+
+    # Shared state block; every instance owns one row (see _COL_* above)
+    _state = np.zeros((0, 12))
+
     def __init__(self, diagram_type, name, handle_length=3.0, aircraft_arm=1.5,
                  x1_constrained=False):
+        # Claim a row in the shared SoA block before any property writes
+        self._idx = TugDiagram._state.shape[0]
+        TugDiagram._state = np.vstack([TugDiagram._state, np.zeros((1, 12))])
+
         self.diagram_type = diagram_type
         self.name = name
         self.gray_angle = GRAY_ARM_ANGLE
@@ -218,74 +460,110 @@ class TugDiagram:
         self.x1_constrained = x1_constrained
         
         # Configure based on type
-        if diagram_type in [1, 2]:
-            self.gold_angle = 90 - self.gray_angle
-            self.has_bend = True
-        elif diagram_type == 3:
-            self.gold_angle = 0
-            self.has_bend = False
-        elif diagram_type in [4, 5]:
-            self.gold_angle = 90 - self.gray_angle
-            self.has_bend = False
-        else:
-            self.gold_angle = 0
-            self.has_bend = False
-        
+        self.gold_angle, self.has_bend = _TYPE_TABLE[diagram_type]
+        self._uses_arm_directly = diagram_type in (3, 6)
+
         self.x1_initial = 0.0
-        self.x1_current = 0.0
-        self.f_handle = 0.0
-        self.f_pull = 0.0
-        
-        # Per-diagram calculated values
-        self.motor_torque = 0.0
-        self.motor_power_hp = 0.0
-        self.motor_power_w = 0.0
-        
+
         # Click detection rect (set during draw)
         self.panel_rect = None
-        
+
+        # Cached static render layer (arms/tire/labels); rebuilt by the
+        # calculator whenever geometry changes or the panel is resized
+        self._static_surf = None
+        self._static_size = None
+        self._static_sig = None
+        self._static_dirty = True
+        self._p1_local = (0.0, 0.0)
+        self._p2_local = (0.0, 0.0)
+        self._p1_off = (0.0, 0.0)
+        self._gold_off = (0.0, 0.0)
+
+        # Full panel composite (background + static layer + force arrows);
+        # an unchanged diagram redraws as one blit of this surface
+        self._comp_surf = None
+        self._comp_sig = None
+
         self._recalculate_geometry()
+
+    # ------------------------------------------------------------------
+    # Property views into the shared SoA state block
+    # ------------------------------------------------------------------
+    @property
+    def x1_current(self):
+        return TugDiagram._state[self._idx, _COL_X1]
+
+    @x1_current.setter
+    def x1_current(self, value):
+        TugDiagram._state[self._idx, _COL_X1] = value
+
+    @property
+    def handle_length(self):
+        return TugDiagram._state[self._idx, _COL_HANDLE]
+
+    @handle_length.setter
+    def handle_length(self, value):
+        TugDiagram._state[self._idx, _COL_HANDLE] = value
+
+    @property
+    def aircraft_arm(self):
+        return TugDiagram._state[self._idx, _COL_ARM]
+
+    @aircraft_arm.setter
+    def aircraft_arm(self, value):
+        TugDiagram._state[self._idx, _COL_ARM] = value
+
+    @property
+    def f_pull(self):
+        return TugDiagram._state[self._idx, _COL_F_PULL]
+
+    @property
+    def f_handle(self):
+        return TugDiagram._state[self._idx, _COL_F_HANDLE]
+
+    @property
+    def motor_torque(self):
+        return TugDiagram._state[self._idx, _COL_TORQUE]
+
+    @property
+    def motor_power_hp(self):
+        return TugDiagram._state[self._idx, _COL_HP]
+
+    @property
+    def motor_power_w(self):
+        return TugDiagram._state[self._idx, _COL_W]
+
+    @property
+    def torque_nm(self):
+        return TugDiagram._state[self._idx, _COL_NM]
+
+    @property
+    def torque_kgcm(self):
+        return TugDiagram._state[self._idx, _COL_KGCM]
+
+    @property
+    def f_arrow_len(self):
+        return TugDiagram._state[self._idx, _COL_FH_ARROW]
+
+    @property
+    def pull_arrow_len(self):
+        return TugDiagram._state[self._idx, _COL_FP_ARROW]
     
     def _recalculate_geometry(self, x1_target=None):
-        gold_base_angle = (180 - self.gray_angle) - 90
-        cos_gold = math.cos(math.radians(gold_base_angle))
-        
-        if self.diagram_type == 3 or self.diagram_type == 6:
-            self.x1_initial = self.aircraft_arm
-        elif self.x1_constrained:
-            self.x1_initial = x1_target if x1_target is not None else 1.5
-            self.aircraft_arm = self.x1_initial / cos_gold
-        else:
-            self.x1_initial = self.aircraft_arm * cos_gold
-        
+        self.x1_initial, self.aircraft_arm = _geom(
+            self._uses_arm_directly, self.gray_angle, self.aircraft_arm,
+            self.x1_constrained, x1_target)
         self.x1_current = self.x1_initial
+        self._static_dirty = True
     
-    def set_arm_lengths(self, handle_length, aircraft_arm):
-        self.handle_length = handle_length
-        if self.x1_constrained:
-            self._recalculate_geometry(x1_target=aircraft_arm)
-        else:
-            self.aircraft_arm = aircraft_arm
-            self._recalculate_geometry()
-    
-    def calculate_forces(self, f_pull):
-        """Calculate handle force and motor specs for this specific config."""
-        self.f_pull = f_pull
-        
-        if self.handle_length > 0.01:
-            self.f_handle = (f_pull * self.x1_current) / self.handle_length
-        else:
-            self.f_handle = 0.0
-        
-        # Motor specs for THIS diagram's handle force
-        # Motor needs to provide equivalent force at the tire
-        self.motor_torque = abs(self.f_handle) * TIRE_RADIUS_FT
-        omega = TARGET_SPEED_FPS / TIRE_RADIUS_FT
-        power_ft_lb_s = self.motor_torque * omega
-        self.motor_power_hp = power_ft_lb_s / 550
-        self.motor_power_w = self.motor_power_hp * 745.7
-        
-        return self.f_handle
+    @classmethod
+    def calculate_forces_all(cls, f_pull):
+        """Calculate handle force and motor specs for every diagram at once.
+
+        One vectorized pass over the shared state block replaces the old
+        per-instance calculate_forces loop.
+        """
+        _forces_kernel(cls._state, f_pull)
     
     def contains_point(self, pos):
         """Check if position is inside this diagram's panel."""
@@ -298,6 +576,10 @@ class TugDiagram:
 # MAIN CALCULATOR
 # ==============================================================================
 
+# Number keys 1-6 select a diagram
+_KEY_TO_IDX = {pygame.K_1 + i: i for i in range(6)}
+
+
 class TugCalculator:
     def __init__(self):
         pygame.init()
@@ -344,6 +626,14 @@ class TugCalculator:
         
         # Selected diagram index (0-5)
         self.selected_idx = 0
+
+        # Masks over the diagrams' rows in the shared state block, so the
+        # per-frame geometry update runs as one vectorized pass
+        types = np.array([d.diagram_type for d in self.diagrams])
+        self._row0 = self.diagrams[0]._idx
+        self._type6_mask = types == 6
+        self._direct_mask = (types == 3) | (types == 6)
+        self._constrained_mask = np.array([d.x1_constrained for d in self.diagrams])
         
         # ==================================================================
         # LEFT PANEL CONTROLS
@@ -354,7 +644,7 @@ class TugCalculator:
         self.weight_slider = Slider(
             left_x, 80, 160, 12,
             "Aircraft Weight:", 500, 10000, DEFAULT_AIRCRAFT_WEIGHT,
-            self.font_sm, "lb", 0, COLORS['aircraft']
+            self.font_sm, "lb", 0, COLOR_TABLE[C.aircraft]
         )
         
         # Surface buttons
@@ -369,27 +659,106 @@ class TugCalculator:
         self.incline_slider = Slider(
             left_x, 330, 160, 12,
             "Incline:", -2.0, 2.0, DEFAULT_INCLINE,
-            self.font_sm, "°", 1, COLORS['angle_indicator']
+            self.font_sm, "°", 1, COLOR_TABLE[C.angle_indicator]
         )
         
         # Arm sliders
         self.handle_slider = Slider(
             left_x, 420, 160, 12,
             "Handle Arm (X):", 1.0, 6.0, DEFAULT_HANDLE_LENGTH,
-            self.font_sm, "ft", 1, COLORS['left_arm']
+            self.font_sm, "ft", 1, COLOR_TABLE[C.left_arm]
         )
         
         self.aircraft_arm_slider = Slider(
             left_x, 500, 160, 12,
             "Aircraft Arm (C):", 0.5, 4.0, DEFAULT_AIRCRAFT_ARM,
-            self.font_sm, "ft", 2, COLORS['right_arm']
+            self.font_sm, "ft", 2, COLOR_TABLE[C.right_arm]
         )
         
         # Reset button
         self.btn_reset = Button(left_x, 580, 160, 35, "RESET", self.font_md)
-        
+
+        # Redraw flag - the scene only repaints when something changed
+        self._dirty = True
+
+        # The whole left panel composites into one offscreen surface; it is
+        # rebuilt only when a control changes and blitted in a single call
+        self._panel_surf = pygame.Surface((LEFT_PANEL_WIDTH, WINDOW_HEIGHT)).convert()
+        self._panel_dirty = True
+
+        # Right panel static chrome, baked lazily on first draw
+        self._right_panel_bg = None
+
+        # Snapshot of the physics inputs; the solve reruns only when one of
+        # them actually changed, not on every repaint
+        self._last_vals = None
+
+        # Flat bounds for every hoverable widget so the per-frame hover test
+        # is one vectorized containment check instead of N collidepoint calls
+        self._hover_widgets = [btn for btn, _, _ in self.surface_buttons] + [self.btn_reset]
+        self._hover_bounds = np.array([(b.rect.x, b.rect.y, b.rect.right, b.rect.bottom)
+                                       for b in self._hover_widgets])
+
+        # Pre-baked tire sprite (tire, rim, pivot dot) - rasterized once and
+        # blitted per diagram instead of three circle draws
+        tire_r = int(TIRE_RADIUS_FT * SCALE * 1.8)
+        size = 2 * tire_r + 4
+        tire = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = size // 2
+        pygame.draw.circle(tire, COLOR_TABLE[C.tire], (center, center), tire_r)
+        pygame.draw.circle(tire, COLOR_TABLE[C.tire_rim], (center, center), int(tire_r * 0.5))
+        pygame.draw.circle(tire, COLOR_TABLE[C.pivot], (center, center), int(tire_r * 0.2))
+        self._tire_surf = tire.convert_alpha()
+        self._tire_half = center
+
+        # Shared panel-background sprites (normal / selected) - the rounded
+        # rect rasterizes once per panel size instead of once per panel per
+        # frame
+        self._panel_bg = None
+        self._panel_bg_sel = None
+        self._panel_bg_size = None
+
+        # Scratch vertex list for the arrow heads (mutated in place)
+        self._arrow_pts = [[0.0, 0.0], [0.0, 0.0], [0.0, 0.0]]
+
         self._update_calculations()
     
+    def _update_diagrams_all(self, handle_len, aircraft_arm):
+        """Update every diagram's arm geometry in one vectorized pass.
+
+        Replaces the per-diagram set_arm_lengths loop; type-dependent
+        branches are precomputed boolean masks over the shared state block.
+        """
+        s = TugDiagram._state[self._row0:self._row0 + len(self.diagrams)]
+        old_handle = s[:, _COL_HANDLE].copy()
+        old_arm = s[:, _COL_ARM].copy()
+        old_x1 = s[:, _COL_X1].copy()
+
+        # D4 "Extended" runs with longer arms than the sliders say
+        s[:, _COL_HANDLE] = np.where(self._type6_mask, handle_len + 1.0, handle_len)
+        arm_in = np.where(self._type6_mask, aircraft_arm + 0.5, aircraft_arm)
+
+        # Horizontal/constrained diagrams take X1 straight from the input;
+        # the rest project the arm through cos(gold angle)
+        x1 = np.where(self._direct_mask | self._constrained_mask, arm_in, arm_in * _COS_GOLD)
+        s[:, _COL_ARM] = np.where(self._constrained_mask, arm_in / _COS_GOLD, arm_in)
+        s[:, _COL_X1] = x1
+
+        # Pixel-space arm endpoints, with all the trig hoisted out of the
+        # draw path (both base angles are fixed, so these are multiply-adds)
+        gray_px = s[:, _COL_HANDLE] * (SCALE * _INV_COS_GRAY)
+        arm_px = s[:, _COL_ARM] * SCALE
+
+        changed = ((s[:, _COL_HANDLE] != old_handle) |
+                   (s[:, _COL_ARM] != old_arm) |
+                   (s[:, _COL_X1] != old_x1))
+        for diag, x1_val, g, a, ch in zip(self.diagrams, x1, gray_px, arm_px, changed):
+            diag.x1_initial = x1_val
+            diag._p1_off = (g * _COS_GRAY, -g * _SIN_GRAY)
+            diag._gold_off = (a * _COS_GOLD, -a * _SIN_GOLD)
+            if ch:
+                diag._static_dirty = True
+
     def _update_calculations(self):
         """Update all calculations."""
         self.aircraft_weight = self.weight_slider.get_value()
@@ -405,18 +774,15 @@ class TugCalculator:
         handle_len = self.handle_slider.get_value()
         aircraft_arm = self.aircraft_arm_slider.get_value()
         
-        for diag in self.diagrams:
-            if diag.diagram_type == 6:
-                diag.set_arm_lengths(handle_len + 1.0, aircraft_arm + 0.5)
-            else:
-                diag.set_arm_lengths(handle_len, aircraft_arm)
-            diag.calculate_forces(self.f_pull_total)
+        self._update_diagrams_all(handle_len, aircraft_arm)
+        TugDiagram.calculate_forces_all(self.f_pull_total)
     
     def _select_surface(self, name, coeff):
         self.current_surface = name
         self.friction_coeff = coeff
         for btn, n, _ in self.surface_buttons:
             btn.active = (n == name)
+        self._panel_dirty = True
         self._update_calculations()
     
     def reset(self):
@@ -427,309 +793,381 @@ class TugCalculator:
         self._select_surface('Clean Concrete', FRICTION_PRESETS['Clean Concrete'])
         self.selected_idx = 0
     
-    def draw_arrow(self, surf, start, end, color, width=3):
+    def draw_arrow_axis(self, surf, start, end, color, axis, width=3):
+        """Axis-aligned arrow (axis 0 = horizontal, 1 = vertical).
+
+        The force arrows are always drawn along an axis, so the direction
+        is a sign compare and the head offsets are fixed - no sqrt or
+        normalization needed. The vertex list is mutated in place to
+        avoid per-call tuple churn.
+        """
         pygame.draw.line(surf, color, start, end, width)
-        dx, dy = end[0] - start[0], end[1] - start[1]
-        length = math.sqrt(dx*dx + dy*dy)
-        if length < 1:
-            return
-        dx, dy = dx/length, dy/length
-        px, py = -dy, dx
-        hs = 9
-        p1 = (end[0] - hs*dx + hs*0.4*px, end[1] - hs*dy + hs*0.4*py)
-        p2 = (end[0] - hs*dx - hs*0.4*px, end[1] - hs*dy - hs*0.4*py)
-        pygame.draw.polygon(surf, color, [end, p1, p2])
+        pts = self._arrow_pts
+        pts[0][0], pts[0][1] = end
+        if axis == 0:
+            bx = end[0] - (9 if end[0] >= start[0] else -9)
+            pts[1][0], pts[1][1] = bx, end[1] + 3.6
+            pts[2][0], pts[2][1] = bx, end[1] - 3.6
+        else:
+            by = end[1] - (9 if end[1] >= start[1] else -9)
+            pts[1][0], pts[1][1] = end[0] + 3.6, by
+            pts[2][0], pts[2][1] = end[0] - 3.6, by
+        pygame.draw.polygon(surf, color, pts)
     
-    def draw_tire(self, surf, cx, cy, radius_px):
-        pygame.draw.circle(surf, COLORS['tire'], (int(cx), int(cy)), int(radius_px))
-        pygame.draw.circle(surf, COLORS['tire_rim'], (int(cx), int(cy)), int(radius_px * 0.5))
-        pygame.draw.circle(surf, COLORS['pivot'], (int(cx), int(cy)), int(radius_px * 0.2))
+    def draw_tire(self, surf, cx, cy):
+        surf.blit(self._tire_surf, (int(cx) - self._tire_half, int(cy) - self._tire_half))
     
-    def draw_diagram(self, surf, diag, px, py, pw, ph, selected=False):
-        """Draw a diagram panel. Returns the panel rect for click detection."""
-        # Store rect for click detection
-        diag.panel_rect = pygame.Rect(px, py, pw, ph)
-        
-        # Background
-        bg_color = COLORS['bg_selected'] if selected else COLORS['bg_panel']
-        pygame.draw.rect(surf, bg_color, diag.panel_rect, border_radius=8)
-        
-        # Selection border
-        if selected:
-            pygame.draw.rect(surf, COLORS['selection_border'], diag.panel_rect, 3, border_radius=8)
-        
+    def _build_diagram_static(self, diag, pw, ph):
+        """Render a diagram's geometry-dependent layer (arms, tire, dims) once.
+
+        The result is cached on the diagram and blitted each frame; only the
+        force arrows and value labels are drawn live on top.
+        """
+        surf = pygame.Surface((pw, ph), pygame.SRCALPHA)
+
         # Title
-        title = self.font_sm.render(diag.name, True, COLORS['text'])
-        surf.blit(title, (px + pw//2 - title.get_width()//2, py + 8))
-        
+        title = _render_text(self.font_sm, diag.name, COLOR_TABLE[C.text])
+        surf.blit(title, (pw//2 - title.get_width()//2, 8))
+
         # Diagram center
-        pivot_x = px + pw // 2
-        pivot_y = py + ph // 2 + 15
-        
+        pivot_x = pw // 2
+        pivot_y = ph // 2 + 15
+
         # Ground line
-        pygame.draw.line(surf, COLORS['grid'], 
+        pygame.draw.line(surf, COLOR_TABLE[C.grid],
                         (pivot_x - 80, pivot_y + 12), (pivot_x + 80, pivot_y + 12), 1)
-        
+
         # GRAY ARM (Handle)
-        gray_rad = math.radians(180 - diag.gray_angle)
-        gray_length = diag.handle_length / math.cos(math.radians(diag.gray_angle))
-        p1_x = pivot_x + gray_length * SCALE * math.cos(gray_rad)
-        p1_y = pivot_y - gray_length * SCALE * math.sin(gray_rad)
-        
-        pygame.draw.line(surf, COLORS['left_arm'], (pivot_x, pivot_y), (p1_x, p1_y), 5)
-        pygame.draw.circle(surf, COLORS['f_handle'], (int(p1_x), int(p1_y)), 4)
-        
-        # Handle force arrow
-        f_arrow_len = 30 + min(abs(diag.f_handle) / 10, 20)
-        self.draw_arrow(surf, (p1_x, p1_y - 3), (p1_x, p1_y + f_arrow_len), COLORS['f_handle'])
-        
-        # Handle force value
-        f_lbl = self.font_sm.render(f"{diag.f_handle:.0f} lb", True, COLORS['f_handle'])
-        surf.blit(f_lbl, (p1_x - 22, p1_y + f_arrow_len + 1))
-        
+        p1_x = pivot_x + diag._p1_off[0]
+        p1_y = pivot_y + diag._p1_off[1]
+
+        pygame.draw.line(surf, COLOR_TABLE[C.left_arm], (pivot_x, pivot_y), (p1_x, p1_y), 5)
+        pygame.draw.circle(surf, COLOR_TABLE[C.f_handle], (int(p1_x), int(p1_y)), 4)
+
         # GOLD ARM
         visual_type = diag.diagram_type
         if visual_type == 2:
             visual_type = 1
         elif visual_type == 5:
             visual_type = 4
-        
+
         if visual_type == 1:
             # L-shape
-            gold_base_angle = (180 - diag.gray_angle) - 90
-            bend_x = pivot_x + diag.aircraft_arm * SCALE * math.cos(math.radians(gold_base_angle))
-            bend_y = pivot_y - diag.aircraft_arm * SCALE * math.sin(math.radians(gold_base_angle))
+            bend_x = pivot_x + diag._gold_off[0]
+            bend_y = pivot_y + diag._gold_off[1]
             p2_x, p2_y = bend_x, pivot_y
-            pygame.draw.line(surf, COLORS['right_arm'], (pivot_x, pivot_y), (bend_x, bend_y), 5)
-            pygame.draw.line(surf, COLORS['right_arm'], (bend_x, bend_y), (p2_x, p2_y), 5)
-            pygame.draw.circle(surf, COLORS['right_arm'], (int(bend_x), int(bend_y)), 3)
+            # Both segments in one polyline call
+            pygame.draw.lines(surf, COLOR_TABLE[C.right_arm], False,
+                              [(pivot_x, pivot_y), (bend_x, bend_y), (p2_x, p2_y)], 5)
+            pygame.draw.circle(surf, COLOR_TABLE[C.right_arm], (int(bend_x), int(bend_y)), 3)
         elif visual_type == 3 or visual_type == 6:
             # Horizontal
             p2_x = pivot_x + diag.aircraft_arm * SCALE
             p2_y = pivot_y
-            pygame.draw.line(surf, COLORS['right_arm'], (pivot_x, pivot_y), (p2_x, p2_y), 5)
+            pygame.draw.line(surf, COLOR_TABLE[C.right_arm], (pivot_x, pivot_y), (p2_x, p2_y), 5)
         else:
             # Angled
-            gold_base_angle = (180 - diag.gray_angle) - 90
-            p2_x = pivot_x + diag.aircraft_arm * SCALE * math.cos(math.radians(gold_base_angle))
-            p2_y = pivot_y - diag.aircraft_arm * SCALE * math.sin(math.radians(gold_base_angle))
-            pygame.draw.line(surf, COLORS['right_arm'], (pivot_x, pivot_y), (p2_x, p2_y), 5)
-        
-        # P2 and pull arrow
-        pygame.draw.circle(surf, COLORS['f_pull'], (int(p2_x), int(p2_y)), 4)
-        pull_len = 25 + min(abs(diag.f_pull) / 20, 15)
-        self.draw_arrow(surf, (p2_x + 2, p2_y), (p2_x + pull_len, p2_y), COLORS['f_pull'])
-        
+            p2_x = pivot_x + diag._gold_off[0]
+            p2_y = pivot_y + diag._gold_off[1]
+            pygame.draw.line(surf, COLOR_TABLE[C.right_arm], (pivot_x, pivot_y), (p2_x, p2_y), 5)
+
+        # P2 marker
+        pygame.draw.circle(surf, COLOR_TABLE[C.f_pull], (int(p2_x), int(p2_y)), 4)
+
         # X1 dimension
         x1_px = diag.x1_current * SCALE
         dim_y = pivot_y + 25
-        pygame.draw.line(surf, COLORS['moment_arm'], (pivot_x, dim_y), (pivot_x + x1_px, dim_y), 1)
-        x1_lbl = self.font_xs.render(f"X1={diag.x1_current:.2f}", True, COLORS['moment_arm'])
+        pygame.draw.line(surf, COLOR_TABLE[C.moment_arm], (pivot_x, dim_y), (pivot_x + x1_px, dim_y), 1)
+        x1_lbl = _render_text(self.font_xs, "X1=" + _fmt(diag.x1_current, '.2f'), COLOR_TABLE[C.moment_arm])
         surf.blit(x1_lbl, (pivot_x + x1_px/2 - 20, dim_y + 2))
-        
+
         # Tire
-        self.draw_tire(surf, pivot_x, pivot_y, TIRE_RADIUS_FT * SCALE * 1.8)
+        self.draw_tire(surf, pivot_x, pivot_y)
+
+        # Anchor points for the dynamic force arrows
+        diag._p1_local = (p1_x, p1_y)
+        diag._p2_local = (p2_x, p2_y)
+        diag._static_surf = surf.convert_alpha()
+        diag._static_size = (pw, ph)
+
+    def _build_diagram_composite(self, diag, pw, ph, selected):
+        """Re-composite a diagram's full panel (bg + static layer + arrows)."""
+        # Background (prebaked rounded-rect sprites, shared by all panels)
+        if self._panel_bg_size != (pw, ph):
+            bg = pygame.Surface((pw, ph), pygame.SRCALPHA)
+            pygame.draw.rect(bg, COLOR_TABLE[C.bg_panel], (0, 0, pw, ph), border_radius=8)
+            sel = pygame.Surface((pw, ph), pygame.SRCALPHA)
+            pygame.draw.rect(sel, COLOR_TABLE[C.bg_selected], (0, 0, pw, ph), border_radius=8)
+            pygame.draw.rect(sel, COLOR_TABLE[C.selection_border], (0, 0, pw, ph), 3, border_radius=8)
+            self._panel_bg = bg.convert_alpha()
+            self._panel_bg_sel = sel.convert_alpha()
+            self._panel_bg_size = (pw, ph)
+
+        # Static layer - rebuilt only when the geometry actually changed
+        if diag._static_dirty or diag._static_size != (pw, ph):
+            sig = (pw, ph, float(diag.handle_length), diag.aircraft_arm, float(diag.x1_current))
+            if sig != diag._static_sig:
+                self._build_diagram_static(diag, pw, ph)
+                diag._static_sig = sig
+            diag._static_dirty = False
+
+        comp = diag._comp_surf
+        if comp is None or comp.get_size() != (pw, ph):
+            comp = pygame.Surface((pw, ph), pygame.SRCALPHA).convert_alpha()
+            diag._comp_surf = comp
+        comp.fill((0, 0, 0, 0))
+        comp.blit(self._panel_bg_sel if selected else self._panel_bg, (0, 0))
+        comp.blit(diag._static_surf, (0, 0))
+
+        p1_x, p1_y = diag._p1_local
+        p2_x, p2_y = diag._p2_local
+
+        # Handle force arrow (length precomputed in the force kernel)
+        f_arrow_len = diag.f_arrow_len
+        self.draw_arrow_axis(comp, (p1_x, p1_y - 3), (p1_x, p1_y + f_arrow_len), COLOR_TABLE[C.f_handle], 1)
+
+        # Handle force value (quantized to whole pounds, so the cache hits
+        # across sub-pound slider motion)
+        f_lbl = _render_text(self.font_sm, _fmt(diag.f_handle, '.0f') + " lb", COLOR_TABLE[C.f_handle])
+        comp.blit(f_lbl, (p1_x - 22, p1_y + f_arrow_len + 1))
+
+        # Pull arrow
+        pull_len = diag.pull_arrow_len
+        self.draw_arrow_axis(comp, (p2_x + 2, p2_y), (p2_x + pull_len, p2_y), COLOR_TABLE[C.f_pull], 0)
+
+    def draw_diagram(self, surf, diag, px, py, pw, ph, selected=False):
+        """Draw a diagram panel. Returns the panel rect for click detection."""
+        # Store rect for click detection (rebuilt only when the layout moves)
+        if diag.panel_rect is None or diag.panel_rect.x != px or diag.panel_rect.y != py \
+                or diag.panel_rect.w != pw or diag.panel_rect.h != ph:
+            diag.panel_rect = pygame.Rect(px, py, pw, ph)
+
+        # Re-composite only when this diagram's inputs changed; a repaint
+        # caused by something else (another panel's selection, hover, etc.)
+        # costs one blit per diagram
+        sig = (pw, ph, selected, float(diag.f_handle), float(diag.f_pull))
+        if diag._static_dirty or sig != diag._comp_sig:
+            self._build_diagram_composite(diag, pw, ph, selected)
+            diag._comp_sig = sig
+        surf.blit(diag._comp_surf, (px, py))
     
-    def draw_left_panel(self):
-        """Draw the left controls panel."""
+    def _build_left_panel(self):
+        """Re-composite the controls panel into its offscreen surface."""
+        panel = self._panel_surf
+
         # Panel background
-        pygame.draw.rect(self.screen, COLORS['bg_panel'], 
-                        (0, 0, LEFT_PANEL_WIDTH, WINDOW_HEIGHT))
-        
+        panel.fill(COLOR_TABLE[C.bg_panel])
+
         # Title
-        title = self.font_title.render("Controls", True, COLORS['text'])
-        self.screen.blit(title, (20, 15))
-        
+        title = _render_text(self.font_title, "Controls", COLOR_TABLE[C.text])
+        panel.blit(title, (20, 15))
+
         # Separator
-        pygame.draw.line(self.screen, COLORS['text_dim'], (15, 50), (LEFT_PANEL_WIDTH - 15, 50), 1)
-        
-        # Draw all controls
-        self.weight_slider.draw(self.screen)
-        
+        pygame.draw.line(panel, COLOR_TABLE[C.text_dim], (15, 50), (LEFT_PANEL_WIDTH - 15, 50), 1)
+
+        # Draw all sliders in one batched blit call
+        panel.blits([
+            self.weight_slider.blit_pair(),
+            self.incline_slider.blit_pair(),
+            self.handle_slider.blit_pair(),
+            self.aircraft_arm_slider.blit_pair(),
+        ], doreturn=False)
+
         # Surface label
-        surf_lbl = self.font_sm.render("Surface Type:", True, COLORS['text'])
-        self.screen.blit(surf_lbl, (20, 130))
-        
+        surf_lbl = _render_text(self.font_sm, "Surface Type:", COLOR_TABLE[C.text])
+        panel.blit(surf_lbl, (20, 130))
+
         for btn, _, _ in self.surface_buttons:
-            btn.draw(self.screen)
-        
-        self.incline_slider.draw(self.screen)
-        self.handle_slider.draw(self.screen)
-        self.aircraft_arm_slider.draw(self.screen)
-        self.btn_reset.draw(self.screen)
-        
+            btn.draw(panel)
+
+        self.btn_reset.draw(panel)
+
         # Instructions
-        inst1 = self.font_xs.render("Click diagram to", True, COLORS['text_dim'])
-        inst2 = self.font_xs.render("see its details →", True, COLORS['text_dim'])
-        self.screen.blit(inst1, (20, 640))
-        self.screen.blit(inst2, (20, 655))
+        inst1 = _render_text(self.font_xs, "Click diagram to", COLOR_TABLE[C.text_dim])
+        inst2 = _render_text(self.font_xs, "see its details →", COLOR_TABLE[C.text_dim])
+        panel.blit(inst1, (20, 640))
+        panel.blit(inst2, (20, 655))
+
+        self._panel_dirty = False
+
+    def draw_left_panel(self):
+        """Draw the left controls panel (one blit unless a control changed)."""
+        if (self._panel_dirty or
+                self.weight_slider._dirty or self.incline_slider._dirty or
+                self.handle_slider._dirty or self.aircraft_arm_slider._dirty):
+            self._build_left_panel()
+        self.screen.blit(self._panel_surf, (0, 0))
     
+    def _build_right_panel_bg(self):
+        """Bake the right panel's static chrome (bg, headers, separators).
+
+        Positions mirror draw_right_panel's y bookkeeping; only labels
+        whose text never changes live here.
+        """
+        panel = pygame.Surface((RIGHT_PANEL_WIDTH, WINDOW_HEIGHT)).convert()
+        panel.fill(COLOR_TABLE[C.bg_panel])
+
+        panel.blit(_render_text(self.font_title, "Results", COLOR_TABLE[C.text]), (15, 15))
+        pygame.draw.line(panel, COLOR_TABLE[C.text_dim], (10, 75), (RIGHT_PANEL_WIDTH - 10, 75), 1)
+
+        y = 90
+        panel.blit(_render_text(self.font_md, "Force Breakdown", COLOR_TABLE[C.text]), (15, y))
+        y += 25 + 18 + 22
+        panel.blit(_render_text(self.font_sm, "Rolling Resistance:", COLOR_TABLE[C.text]), (15, y))
+        y += 40
+        panel.blit(_render_text(self.font_sm, "Grade Resistance:", COLOR_TABLE[C.text]), (15, y))
+        y += 55
+        pygame.draw.line(panel, COLOR_TABLE[C.text_dim], (15, y), (RIGHT_PANEL_WIDTH - 15, y), 1)
+        y += 10
+        panel.blit(_render_text(self.font_md, "Total Pull Force:", COLOR_TABLE[C.text]), (15, y))
+        y += 65
+        pygame.draw.line(panel, COLOR_TABLE[C.f_handle], (10, y), (RIGHT_PANEL_WIDTH - 10, y), 2)
+        y += 10
+        panel.blit(_render_text(self.font_md, "Handle Force Required:", COLOR_TABLE[C.text]), (15, y))
+        y += 22 + 30 + 40
+        pygame.draw.line(panel, COLOR_TABLE[C.motor_specs], (10, y), (RIGHT_PANEL_WIDTH - 10, y), 2)
+        y += 10
+        panel.blit(_render_text(self.font_md, f"Motor Specs @ {TARGET_SPEED_MPH:.0f} mph",
+                                COLOR_TABLE[C.motor_specs]), (15, y))
+        y += 22 + 18 + 18 + 22 + 18 + 22
+        panel.blit(_render_text(self.font_xs, f"(Based on {TIRE_DIAMETER_IN:.0f}\" wheel)",
+                                COLOR_TABLE[C.text_dim]), (15, y))
+        y += 35
+        pygame.draw.line(panel, COLOR_TABLE[C.text_dim], (10, y), (RIGHT_PANEL_WIDTH - 10, y), 1)
+        y += 10
+        panel.blit(_render_text(self.font_md, "Geometry", COLOR_TABLE[C.text]), (15, y))
+
+        self._right_panel_bg = panel
+
     def draw_right_panel(self):
         """Draw the right results panel for selected diagram."""
         rx = WINDOW_WIDTH - RIGHT_PANEL_WIDTH
-        
-        # Panel background
-        pygame.draw.rect(self.screen, COLORS['bg_panel'], 
-                        (rx, 0, RIGHT_PANEL_WIDTH, WINDOW_HEIGHT))
-        
+
+        # Static chrome (bg, headers, separators) in one blit
+        if self._right_panel_bg is None:
+            self._build_right_panel_bg()
+        self.screen.blit(self._right_panel_bg, (rx, 0))
+
         # Get selected diagram
         diag = self.diagrams[self.selected_idx]
-        
-        # Title
-        title = self.font_title.render("Results", True, COLORS['text'])
-        self.screen.blit(title, (rx + 15, 15))
-        
+
         # Selected diagram name
-        sel_lbl = self.font_md.render(f"Selected: {diag.name}", True, COLORS['selection_border'])
+        sel_lbl = _render_text(self.font_md, f"Selected: {diag.name}", COLOR_TABLE[C.selection_border])
         self.screen.blit(sel_lbl, (rx + 15, 45))
-        
-        pygame.draw.line(self.screen, COLORS['text_dim'], (rx + 10, 75), (rx + RIGHT_PANEL_WIDTH - 10, 75), 1)
-        
+
         # ==================================================================
         # FORCE BREAKDOWN (for this diagram)
         # ==================================================================
         y = 90
-        
-        fb_title = self.font_md.render("Force Breakdown", True, COLORS['text'])
-        self.screen.blit(fb_title, (rx + 15, y))
-        
+
         y += 25
-        surf_lbl = self.font_sm.render(f"{self.current_surface}", True, COLORS['text_dim'])
+        surf_lbl = _render_text(self.font_sm, f"{self.current_surface}", COLOR_TABLE[C.text_dim])
         self.screen.blit(surf_lbl, (rx + 15, y))
-        
+
         y += 18
-        coeff_lbl = self.font_xs.render(f"μ = {self.friction_coeff:.3f}", True, COLORS['text_dim'])
+        coeff_lbl = _render_text(self.font_xs, "μ = " + _fmt(self.friction_coeff, '.3f'), COLOR_TABLE[C.text_dim])
         self.screen.blit(coeff_lbl, (rx + 15, y))
-        
+
         y += 22
-        roll_lbl = self.font_sm.render(f"Rolling Resistance:", True, COLORS['text'])
-        self.screen.blit(roll_lbl, (rx + 15, y))
-        roll_val = self.font_sm.render(f"{self.f_rolling:.1f} lb", True, COLORS['f_ground'])
+        roll_val = _render_text(self.font_sm, _fmt(self.f_rolling, '.1f') + " lb", COLOR_TABLE[C.f_ground])
         self.screen.blit(roll_val, (rx + 15, y + 16))
-        
+
         y += 40
-        grade_color = COLORS['good'] if self.f_grade <= 0 else COLORS['warning']
-        grade_lbl = self.font_sm.render(f"Grade Resistance:", True, COLORS['text'])
-        self.screen.blit(grade_lbl, (rx + 15, y))
-        grade_val = self.font_sm.render(f"{self.f_grade:+.1f} lb", True, grade_color)
+        grade_color = COLOR_TABLE[C.good] if self.f_grade <= 0 else COLOR_TABLE[C.warning]
+        grade_val = _render_text(self.font_sm, _fmt(self.f_grade, '+.1f') + " lb", grade_color)
         self.screen.blit(grade_val, (rx + 15, y + 16))
-        
+
         if self.f_grade < 0:
-            help_lbl = self.font_xs.render("(downhill assists)", True, COLORS['good'])
+            help_lbl = _render_text(self.font_xs, "(downhill assists)", COLOR_TABLE[C.good])
             self.screen.blit(help_lbl, (rx + 15, y + 32))
-        
+
         y += 55
-        pygame.draw.line(self.screen, COLORS['text_dim'], (rx + 15, y), (rx + RIGHT_PANEL_WIDTH - 15, y), 1)
-        
         y += 10
-        pull_lbl = self.font_md.render("Total Pull Force:", True, COLORS['text'])
-        self.screen.blit(pull_lbl, (rx + 15, y))
-        pull_val = self.font_lg.render(f"{self.f_pull_total:.1f} lb", True, COLORS['f_pull'])
+        pull_val = _render_text(self.font_lg, _fmt(self.f_pull_total, '.1f') + " lb", COLOR_TABLE[C.f_pull])
         self.screen.blit(pull_val, (rx + 15, y + 22))
-        
+
         # ==================================================================
         # HANDLE FORCE (the main output)
         # ==================================================================
         y += 65
-        pygame.draw.line(self.screen, COLORS['f_handle'], (rx + 10, y), (rx + RIGHT_PANEL_WIDTH - 10, y), 2)
-        
         y += 10
-        handle_title = self.font_md.render("Handle Force Required:", True, COLORS['text'])
-        self.screen.blit(handle_title, (rx + 15, y))
-        
         y += 22
-        handle_val = self.font_lg.render(f"{diag.f_handle:.1f} lb", True, COLORS['f_handle'])
+        handle_val = _render_text(self.font_lg, _fmt(diag.f_handle, '.1f') + " lb", COLOR_TABLE[C.f_handle])
         self.screen.blit(handle_val, (rx + 15, y))
         
         y += 30
         # Effort assessment
         if diag.f_handle <= 50:
-            note, note_color = "Easy for most adults", COLORS['good']
+            note, note_color = "Easy for most adults", COLOR_TABLE[C.good]
         elif diag.f_handle <= 100:
-            note, note_color = "Moderate effort", COLORS['text_highlight']
+            note, note_color = "Moderate effort", COLOR_TABLE[C.text_highlight]
         elif diag.f_handle <= 150:
-            note, note_color = "Significant effort", COLORS['warning']
+            note, note_color = "Significant effort", COLOR_TABLE[C.warning]
         else:
-            note, note_color = "Motor recommended", COLORS['warning']
+            note, note_color = "Motor recommended", COLOR_TABLE[C.warning]
         
-        note_lbl = self.font_sm.render(note, True, note_color)
+        note_lbl = _render_text(self.font_sm, note, note_color)
         self.screen.blit(note_lbl, (rx + 15, y))
         
         # ==================================================================
         # MOTOR SPECS (for this diagram)
         # ==================================================================
         y += 40
-        pygame.draw.line(self.screen, COLORS['motor_specs'], (rx + 10, y), (rx + RIGHT_PANEL_WIDTH - 10, y), 2)
-        
         y += 10
-        motor_title = self.font_md.render(f"Motor Specs @ {TARGET_SPEED_MPH:.0f} mph", True, COLORS['motor_specs'])
-        self.screen.blit(motor_title, (rx + 15, y))
-        
         y += 22
         
-        # Torque in multiple units
-        # Conversions: 1 lb-ft = 1.35582 Nm, 1 Nm = 10.1972 kg.cm
-        torque_nm = diag.motor_torque * 1.35582
-        torque_kgcm = torque_nm * 10.1972
-        
-        torque_lbl1 = self.font_sm.render(f"Torque: {diag.motor_torque:.2f} lb-ft", True, COLORS['text'])
+        # Torque in multiple units (converted in the force kernel)
+        torque_lbl1 = _render_text(self.font_sm, "Torque: " + _fmt(diag.motor_torque, '.2f') + " lb-ft", COLOR_TABLE[C.text])
         self.screen.blit(torque_lbl1, (rx + 15, y))
         
         y += 18
-        torque_lbl2 = self.font_sm.render(f"        {torque_nm:.2f} Nm", True, COLORS['text'])
+        torque_lbl2 = _render_text(self.font_sm, "        " + _fmt(diag.torque_nm, '.2f') + " Nm", COLOR_TABLE[C.text])
         self.screen.blit(torque_lbl2, (rx + 15, y))
         
         y += 18
-        torque_lbl3 = self.font_sm.render(f"        {torque_kgcm:.1f} kg.cm", True, COLORS['text'])
+        torque_lbl3 = _render_text(self.font_sm, "        " + _fmt(diag.torque_kgcm, '.1f') + " kg.cm", COLOR_TABLE[C.text])
         self.screen.blit(torque_lbl3, (rx + 15, y))
         
         y += 22
-        hp_lbl = self.font_sm.render(f"Power: {diag.motor_power_hp:.3f} HP", True, COLORS['text'])
+        hp_lbl = _render_text(self.font_sm, "Power: " + _fmt(diag.motor_power_hp, '.3f') + " HP", COLOR_TABLE[C.text])
         self.screen.blit(hp_lbl, (rx + 15, y))
         
         y += 18
-        watt_lbl = self.font_sm.render(f"       {diag.motor_power_w:.1f} W", True, COLORS['text'])
+        watt_lbl = _render_text(self.font_sm, "       " + _fmt(diag.motor_power_w, '.1f') + " W", COLOR_TABLE[C.text])
         self.screen.blit(watt_lbl, (rx + 15, y))
         
         y += 22
-        wheel_lbl = self.font_xs.render(f"(Based on {TIRE_DIAMETER_IN:.0f}\" wheel)", True, COLORS['text_dim'])
-        self.screen.blit(wheel_lbl, (rx + 15, y))
-        
+
         # ==================================================================
         # GEOMETRY INFO
         # ==================================================================
         y += 35
-        pygame.draw.line(self.screen, COLORS['text_dim'], (rx + 10, y), (rx + RIGHT_PANEL_WIDTH - 10, y), 1)
-        
         y += 10
-        geom_title = self.font_md.render("Geometry", True, COLORS['text'])
-        self.screen.blit(geom_title, (rx + 15, y))
-        
         y += 22
-        x_lbl = self.font_sm.render(f"Handle Arm (X): {diag.handle_length:.1f} ft", True, COLORS['left_arm'])
+        x_lbl = _render_text(self.font_sm, "Handle Arm (X): " + _fmt(diag.handle_length, '.1f') + " ft", COLOR_TABLE[C.left_arm])
         self.screen.blit(x_lbl, (rx + 15, y))
         
         y += 18
-        c_lbl = self.font_sm.render(f"Aircraft Arm (C): {diag.aircraft_arm:.2f} ft", True, COLORS['right_arm'])
+        c_lbl = _render_text(self.font_sm, "Aircraft Arm (C): " + _fmt(diag.aircraft_arm, '.2f') + " ft", COLOR_TABLE[C.right_arm])
         self.screen.blit(c_lbl, (rx + 15, y))
         
         y += 18
-        x1_lbl = self.font_sm.render(f"X1 (horiz dist): {diag.x1_current:.2f} ft", True, COLORS['moment_arm'])
+        x1_lbl = _render_text(self.font_sm, "X1 (horiz dist): " + _fmt(diag.x1_current, '.2f') + " ft", COLOR_TABLE[C.moment_arm])
         self.screen.blit(x1_lbl, (rx + 15, y))
         
         y += 18
         if diag.x1_current > 0.01:
             ma = diag.handle_length / diag.x1_current
-            ma_lbl = self.font_sm.render(f"Mech. Advantage: {ma:.2f}x", True, COLORS['text_dim'])
+            ma_lbl = _render_text(self.font_sm, "Mech. Advantage: " + _fmt(ma, '.2f') + "x", COLOR_TABLE[C.text_dim])
         else:
-            ma_lbl = self.font_sm.render("Mech. Advantage: --", True, COLORS['text_dim'])
+            ma_lbl = _render_text(self.font_sm, "Mech. Advantage: --", COLOR_TABLE[C.text_dim])
         self.screen.blit(ma_lbl, (rx + 15, y))
     
     def run(self):
         while self.running:
             mpos = pygame.mouse.get_pos()
-            clicked = False
-            
+            click_pos = None
+
             for e in pygame.event.get():
                 if e.type == pygame.QUIT:
                     self.running = False
@@ -738,84 +1176,108 @@ class TugCalculator:
                         self.running = False
                     elif e.key == pygame.K_r:
                         self.reset()
-                    elif e.key == pygame.K_1:
-                        self.selected_idx = 0
-                    elif e.key == pygame.K_2:
-                        self.selected_idx = 1
-                    elif e.key == pygame.K_3:
-                        self.selected_idx = 2
-                    elif e.key == pygame.K_4:
-                        self.selected_idx = 3
-                    elif e.key == pygame.K_5:
-                        self.selected_idx = 4
-                    elif e.key == pygame.K_6:
-                        self.selected_idx = 5
+                    elif e.key in _KEY_TO_IDX:
+                        self.selected_idx = _KEY_TO_IDX[e.key]
                 elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                    clicked = True
-                
-                self.weight_slider.handle_event(e)
-                self.incline_slider.handle_event(e)
-                self.handle_slider.handle_event(e)
-                self.aircraft_arm_slider.handle_event(e)
-            
-            # Update buttons
-            for btn, _, _ in self.surface_buttons:
-                btn.update(mpos)
-            self.btn_reset.update(mpos)
-            
-            for btn, name, coeff in self.surface_buttons:
-                if btn.clicked(mpos, clicked):
-                    self._select_surface(name, coeff)
-            
-            if self.btn_reset.clicked(mpos, clicked):
-                self.reset()
+                    # The event already carries the click position - no
+                    # second trip into SDL for the cursor
+                    click_pos = e.pos
+
+                changed = self.weight_slider.handle_event(e)
+                changed |= self.incline_slider.handle_event(e)
+                changed |= self.handle_slider.handle_event(e)
+                changed |= self.aircraft_arm_slider.handle_event(e)
+
+                # Only real input should trigger a repaint; WINDOWEVENT
+                # covers expose/restore, where SDL may have dropped the
+                # backbuffer and the last frame needs redrawing
+                if changed or e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                                         pygame.MOUSEBUTTONUP, pygame.VIDEORESIZE,
+                                         pygame.WINDOWEVENT):
+                    self._dirty = True
+
+            # Update button hover states in one vectorized containment test
+            # (hover transitions need a repaint too)
+            mx, my = mpos
+            b = self._hover_bounds
+            mask = ((b[:, 0] <= mx) & (mx < b[:, 2]) &
+                    (b[:, 1] <= my) & (my < b[:, 3]))
+            for widget, hovered in zip(self._hover_widgets, mask):
+                if hovered != widget.hovered:
+                    widget.hovered = hovered
+                    self._dirty = True
+                    self._panel_dirty = True
             
-            # Check diagram clicks
-            if clicked:
+            if click_pos is not None:
+                for btn, name, coeff in self.surface_buttons:
+                    if btn.clicked(click_pos, True):
+                        self._select_surface(name, coeff)
+
+                if self.btn_reset.clicked(click_pos, True):
+                    self.reset()
+
+                # Check diagram clicks
                 for i, diag in enumerate(self.diagrams):
-                    if diag.contains_point(mpos):
+                    if diag.contains_point(click_pos):
                         self.selected_idx = i
                         break
             
-            self._update_calculations()
-            
+            # Interaction in flight (repaint pending, drag, or hover over a
+            # widget) keeps the loop at full rate; otherwise idle-poll
+            active = (self._dirty or mask.any() or
+                      self.weight_slider.dragging or self.incline_slider.dragging or
+                      self.handle_slider.dragging or self.aircraft_arm_slider.dragging)
+
             # ==============================================================
-            # DRAWING
+            # DRAWING (recalc + repaint skipped entirely while nothing
+            # changed)
             # ==============================================================
-            self.screen.fill(COLORS['bg'])
-            
-            # Header
-            title = self.font_lg.render("Aircraft Tug Force Calculator", True, COLORS['text'])
-            title_x = LEFT_PANEL_WIDTH + (CENTER_WIDTH // 2) - (title.get_width() // 2) + 10
-            self.screen.blit(title, (title_x, 15))
-            
-            # Draw 6 diagrams in center (3x2 grid)
-            diagram_start_x = LEFT_PANEL_WIDTH + 20
-            diagram_start_y = 55
-            diagram_w = (CENTER_WIDTH - 30) // 3
-            diagram_h = (WINDOW_HEIGHT - 80) // 2
-            gap = 10
-            
-            for row in range(2):
-                for col in range(3):
-                    idx = row * 3 + col
-                    px = diagram_start_x + col * (diagram_w + gap)
-                    py = diagram_start_y + row * (diagram_h + gap)
-                    self.draw_diagram(self.screen, self.diagrams[idx], 
-                                     px, py, diagram_w, diagram_h,
-                                     selected=(idx == self.selected_idx))
-            
-            # Draw panels
-            self.draw_left_panel()
-            self.draw_right_panel()
-            
-            # Footer
-            footer = self.font_xs.render("[1-6] Select diagram | [R] Reset | [ESC] Quit", True, COLORS['text_dim'])
-            self.screen.blit(footer, (LEFT_PANEL_WIDTH + CENTER_WIDTH//2 - footer.get_width()//2 + 10, 
-                                     WINDOW_HEIGHT - 18))
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            if self._dirty:
+                vals = (self.weight_slider.value, self.incline_slider.value,
+                        self.handle_slider.value, self.aircraft_arm_slider.value,
+                        self.current_surface)
+                if vals != self._last_vals:
+                    self._update_calculations()
+                    self._last_vals = vals
+
+                self.screen.fill(COLOR_TABLE[C.bg])
+
+                # Header
+                title = _render_text(self.font_lg, "Aircraft Tug Force Calculator", COLOR_TABLE[C.text])
+                title_x = LEFT_PANEL_WIDTH + (CENTER_WIDTH // 2) - (title.get_width() // 2) + 10
+                self.screen.blit(title, (title_x, 15))
+
+                # Draw 6 diagrams in center (3x2 grid)
+                diagram_start_x = LEFT_PANEL_WIDTH + 20
+                diagram_start_y = 55
+                diagram_w = (CENTER_WIDTH - 30) // 3
+                diagram_h = (WINDOW_HEIGHT - 80) // 2
+                gap = 10
+
+                for row in range(2):
+                    for col in range(3):
+                        idx = row * 3 + col
+                        px = diagram_start_x + col * (diagram_w + gap)
+                        py = diagram_start_y + row * (diagram_h + gap)
+                        self.draw_diagram(self.screen, self.diagrams[idx],
+                                         px, py, diagram_w, diagram_h,
+                                         selected=(idx == self.selected_idx))
+
+                # Draw panels
+                self.draw_left_panel()
+                self.draw_right_panel()
+
+                # Footer
+                footer = _render_text(self.font_xs, "[1-6] Select diagram | [R] Reset | [ESC] Quit", COLOR_TABLE[C.text_dim])
+                self.screen.blit(footer, (LEFT_PANEL_WIDTH + CENTER_WIDTH//2 - footer.get_width()//2 + 10,
+                                         WINDOW_HEIGHT - 18))
+
+                pygame.display.flip()
+                self._dirty = False
+
+            # Idle frames poll at a fraction of FPS - enough for hover
+            # latency, near-zero CPU otherwise
+            self.clock.tick(FPS if active else 15)
         
         pygame.quit()
         sys.exit()
@@ -16,6 +16,7 @@ F2 acts vertically, so its moment arm = horizontal distance X1.
 import pygame
 import math
 import sys
+import numpy as np
 
 # ==============================================================================
 # CONFIGURATION
@@ -81,10 +82,18 @@ MOMENT_OF_INERTIA = 35.0
 ANGULAR_DAMPING = 0.25
 MAX_ROTATION = 60
 
+HALF_PI = math.pi * 0.5
+
 # ==============================================================================
 # UI COMPONENTS
 # ==============================================================================
 
+# Widget text blits are queued here and flushed once per frame through a
+# single batched Surface.blits call instead of one Python-level blit per
+# label
+_UI_BLIT_QUEUE = []
+
+
 class Button:
     def __init__(self, x, y, w, h, text, color, font):
         self.rect = pygame.Rect(x, y, w, h)
@@ -92,19 +101,32 @@ class Button:
         self.color = color
         self.font = font
         self.hovered = False
-    
+        # Cached label surface - re-rendered only when the text changes
+        self._txt_surf = self.font.render(self.text, True, COLORS['text']).convert_alpha()
+        self._last_text = self.text
+        # Cached hover color - recomputed only when the base color changes
+        # (the start button swaps color when toggled)
+        self._color_hover = tuple(min(255, c + 30) for c in self.color)
+        self._last_color = self.color
+
     def draw(self, surface):
-        c = tuple(min(255, x + 30) for x in self.color) if self.hovered else self.color
+        if self.color != self._last_color:
+            self._color_hover = tuple(min(255, c + 30) for c in self.color)
+            self._last_color = self.color
+        c = self._color_hover if self.hovered else self.color
         pygame.draw.rect(surface, c, self.rect, border_radius=8)
         pygame.draw.rect(surface, COLORS['text_dim'], self.rect, 2, border_radius=8)
-        txt = self.font.render(self.text, True, COLORS['text'])
-        surface.blit(txt, txt.get_rect(center=self.rect.center))
+        if self.text != self._last_text:
+            self._txt_surf = self.font.render(self.text, True, COLORS['text']).convert_alpha()
+            self._last_text = self.text
+        _UI_BLIT_QUEUE.append(
+            (self._txt_surf, self._txt_surf.get_rect(center=self.rect.center)))
     
     def update(self, pos):
-        self.hovered = self.rect.collidepoint(pos)
+        self.hovered = self.rect.collidepoint(pos[0], pos[1])
     
     def clicked(self, pos, pressed):
-        return self.rect.collidepoint(pos) and pressed
+        return self.rect.collidepoint(pos[0], pos[1]) and pressed
 
 
 class Slider:
@@ -119,61 +141,86 @@ class Slider:
         self.font = font
         self.dragging = False
         self.knob_radius = height // 2 + 4
+        self._knob_radius_sq = self.knob_radius * self.knob_radius
         self.unit = unit          # Unit label (lb, ft, etc.)
         self.decimals = decimals  # Number of decimal places to display
-    
+        self._val_fmt = f"{{:.{decimals}f}} {unit}"
+        # Cached text surfaces - the label never changes, the value string
+        # only changes when the slider moves
+        self._lbl_surf = self.font.render(self.label, True, COLORS['text']).convert_alpha()
+        self._last_val_str = None
+        self._val_surf = None
+        # The background track never changes either - bake it once
+        self._track_surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self._track_surf, COLORS['slider_bg'],
+                         self._track_surf.get_rect(), border_radius=height // 2)
+        # Fill width only changes with the value - cache it rather than
+        # redoing the range division every draw and knob hit-test; the
+        # fill rect is mutated in place instead of reallocated per frame
+        self._inv_range = 1.0 / (max_val - min_val)
+        self._fill_rect = pygame.Rect(x, y, 0, height)
+        self._recompute_fill()
+
+    def _recompute_fill(self):
+        self._fill_width = (self.value - self.min_val) * self._inv_range * self.rect.width
+        self._fill_rect.width = int(self._fill_width)
+        # Knob center as a Vector2 so the hit-test is one C call
+        self._knob_pos = pygame.Vector2(self.rect.x + self._fill_width,
+                                        self.rect.y + self.rect.height // 2)
+
     def draw(self, surface):
         # Label above slider
-        lbl = self.font.render(self.label, True, COLORS['text'])
-        surface.blit(lbl, (self.rect.x, self.rect.y - 25))
+        _UI_BLIT_QUEUE.append((self._lbl_surf, (self.rect.x, self.rect.y - 25)))
         
-        # Background track
-        pygame.draw.rect(surface, COLORS['slider_bg'], self.rect, border_radius=self.rect.height // 2)
+        # Background track (pre-rendered)
+        surface.blit(self._track_surf, self.rect.topleft)
         
         # Filled portion
-        fill_width = ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
-        fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
-        pygame.draw.rect(surface, COLORS['slider_fill'], fill_rect, border_radius=self.rect.height // 2)
-        
+        pygame.draw.rect(surface, COLORS['slider_fill'], self._fill_rect, border_radius=self.rect.height // 2)
+
         # Knob
-        knob_x = self.rect.x + fill_width
+        knob_x = self.rect.x + self._fill_width
         knob_y = self.rect.y + self.rect.height // 2
         pygame.draw.circle(surface, COLORS['slider_knob'], (int(knob_x), int(knob_y)), self.knob_radius)
         pygame.draw.circle(surface, COLORS['slider_fill'], (int(knob_x), int(knob_y)), self.knob_radius - 3)
         
         # Value label with configurable decimals and unit
-        if self.decimals == 0:
-            val_txt = self.font.render(f"{self.value:.0f} {self.unit}", True, COLORS['text'])
-        elif self.decimals == 1:
-            val_txt = self.font.render(f"{self.value:.1f} {self.unit}", True, COLORS['text'])
-        else:
-            val_txt = self.font.render(f"{self.value:.2f} {self.unit}", True, COLORS['text'])
-        surface.blit(val_txt, (self.rect.right + 15, self.rect.y - 3))
+        val_str = self._val_fmt.format(self.value)
+        if val_str != self._last_val_str:
+            self._val_surf = self.font.render(val_str, True, COLORS['text']).convert_alpha()
+            self._last_val_str = val_str
+        _UI_BLIT_QUEUE.append((self._val_surf, (self.rect.right + 15, self.rect.y - 3)))
     
     def handle_event(self, event):
+        """Process one event; returns True if the slider value changed."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check if clicked on knob or track
-            if self.rect.collidepoint(event.pos) or self._knob_hit(event.pos):
+            if self.rect.collidepoint(event.pos[0], event.pos[1]) or self._knob_hit(event.pos):
                 self.dragging = True
-                self._update_value(event.pos[0])
-        
+                return self._update_value(event.pos[0])
+
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             self.dragging = False
-        
+
         elif event.type == pygame.MOUSEMOTION and self.dragging:
-            self._update_value(event.pos[0])
+            return self._update_value(event.pos[0])
+
+        return False
     
     def _knob_hit(self, pos):
-        fill_width = ((self.value - self.min_val) / (self.max_val - self.min_val)) * self.rect.width
-        knob_x = self.rect.x + fill_width
-        knob_y = self.rect.y + self.rect.height // 2
-        dist = math.sqrt((pos[0] - knob_x)**2 + (pos[1] - knob_y)**2)
-        return dist <= self.knob_radius
+        # Squared-distance compare in C via Vector2 - no sqrt, no Python
+        # arithmetic per mouse event
+        return self._knob_pos.distance_squared_to(pos) <= self._knob_radius_sq
     
     def _update_value(self, mouse_x):
         rel_x = mouse_x - self.rect.x
         rel_x = max(0, min(self.rect.width, rel_x))
-        self.value = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
+        value = self.min_val + (rel_x / self.rect.width) * (self.max_val - self.min_val)
+        if value == self.value:
+            return False
+        self.value = value
+        self._recompute_fill()
+        return True
     
     def get_value(self):
         return self.value
@@ -181,11 +228,73 @@ class Slider:
     def reset(self, value):
         """Reset slider to a specific value."""
         self.value = max(self.min_val, min(self.max_val, value))
+        self._recompute_fill()
 
 # ==============================================================================
 # LEVER DIAGRAM
 # ==============================================================================
 
+# Column layout of the shared LeverDiagram state block (SoA): all five
+# levers are stepped in one vectorized pass over this array
+(_COL_ROT, _COL_AVEL, _COL_X1_INIT, _COL_X1_CUR, _COL_ARM1, _COL_ARM2,
+ _COL_F1, _COL_F2, _COL_NTORQ,
+ _COL_V1M, _COL_V1X, _COL_V1Y, _COL_V2M, _COL_V2X, _COL_V2Y,
+ _COL_GRAY_LEN, _COL_GRAY_RAD, _COL_GOLD_RAD, _COL_P2R) = range(19)
+
+
+def _step_all_kernel(s, dt, simulating):
+    """
+    Vectorized physics step over every row of the shared state block.
+
+    Same math as the old per-instance update(): X1 and F2 always refresh;
+    torque integration and the P1/P2 velocities only run while simulating
+    (velocities keep their last value when paused so the user can still
+    read them).
+    """
+    rot = np.radians(s[:, _COL_ROT])
+    cos_rot = np.cos(rot)
+
+    # X1 = horizontal distance from pivot to P2
+    x1 = np.maximum(0.1, np.abs(s[:, _COL_X1_INIT] * cos_rot))
+    s[:, _COL_X1_CUR] = x1
+
+    # F2 = force at P2 from lever mechanics: F2 = (F1 * C) / X1
+    s[:, _COL_F2] = s[:, _COL_F1] * s[:, _COL_ARM1] / x1
+
+    if not simulating:
+        s[:, _COL_NTORQ] = 0.0
+        return
+
+    # Torques: F1 pushes down on P1 (CCW, positive), the hanging weight
+    # pulls down on P2 (CW, negative)
+    c_current = np.maximum(0.1, np.abs(s[:, _COL_ARM1] * cos_rot))
+    net = s[:, _COL_F1] * c_current - WEIGHT * x1
+    s[:, _COL_NTORQ] = net
+
+    avel = s[:, _COL_AVEL]
+    avel += net / MOMENT_OF_INERTIA * dt
+    avel *= (1 - ANGULAR_DAMPING * dt)
+    s[:, _COL_ROT] += avel * dt
+    np.clip(s[:, _COL_ROT], -MAX_ROTATION, MAX_ROTATION, out=s[:, _COL_ROT])
+
+    # Velocities: v = omega * r with omega in rad/s; direction is
+    # perpendicular to the arm, sign following the angular velocity
+    omega = np.radians(avel)
+    half_pi = np.copysign(HALF_PI, avel)
+
+    v1m = np.abs(omega * s[:, _COL_GRAY_LEN])
+    perp = s[:, _COL_GRAY_RAD] + rot + half_pi
+    s[:, _COL_V1M] = v1m
+    s[:, _COL_V1X] = v1m * np.cos(perp)
+    s[:, _COL_V1Y] = -v1m * np.sin(perp)  # Flip for screen coords
+
+    v2m = np.abs(omega * s[:, _COL_P2R])
+    perp = s[:, _COL_GOLD_RAD] + rot + half_pi
+    s[:, _COL_V2M] = v2m
+    s[:, _COL_V2X] = v2m * np.cos(perp)
+    s[:, _COL_V2Y] = -v2m * np.sin(perp)
+
+
 class LeverDiagram:
     """
     Lever system with physics simulation.
@@ -204,18 +313,40 @@ class LeverDiagram:
       5 = D3b (angled arm, no bend, arm2 calculated for X1=1.5)
     """
     
+    # Gray arm geometry is the same for every diagram, so its trig is
+    # evaluated once here rather than per instance (let alone per frame)
+    GRAY_ANGLE_DEG = 40
+    GRAY_RAD_BASE = math.radians(180 - GRAY_ANGLE_DEG)
+    COS_GRAY = math.cos(math.radians(GRAY_ANGLE_DEG))
+    GOLD_BASE_RAD = math.radians((180 - GRAY_ANGLE_DEG) - 90)
+    COS_GOLD = math.cos(GOLD_BASE_RAD)
+    SIN_GOLD = math.sin(GOLD_BASE_RAD)
+
+    # Shared state block; every instance owns one row (see _COL_* above)
+    _state = np.zeros((0, 19))
+
+    # While paused, the physics step only needs to rerun after an input
+    # change (sliders, reset); this flag gates step_all in that case
+    _dirty = True
+
     def __init__(self, diagram_type, name):
         self.diagram_type = diagram_type
         self.name = name
-        
+
+        # Claim a row in the shared state block
+        self._idx = LeverDiagram._state.shape[0]
+        LeverDiagram._state = np.vstack([LeverDiagram._state,
+                                         np.zeros((1, 19))])
+
         # Gray arm angle from horizontal (goes UP-LEFT)
-        self.gray_angle = 40  # degrees
+        self.gray_angle = LeverDiagram.GRAY_ANGLE_DEG  # degrees
         
         # Arm lengths - can be adjusted via sliders
         # arm1_length: horizontal distance from pivot to P1 (grey arm projection)
         # arm2_length: gold arm length (first segment for D1, full arm for D2/D3)
         self.arm1_length = C_DISTANCE          # 3.0 ft default (horizontal projection)
         self.arm2_length = FIRST_SEGMENT_LENGTH  # 1.5 ft default (overridden for types 4,5)
+        self._last_arm_args = None  # last (arm1, arm2) seen by set_arm_lengths
         
         # Flag to indicate if this diagram uses X1-constrained arm2 calculation
         # Types 4 (D1b) and 5 (D3b) have arm2 calculated from X1 = 1.5 constraint
@@ -248,18 +379,36 @@ class LeverDiagram:
         self.x1_current = 0.0
         self.net_torque = 0.0
         
-        # Velocity tracking for P1 and P2
-        # v = ω × r (angular velocity times distance from pivot)
-        self.v1_magnitude = 0.0  # P1 velocity magnitude (ft/s)
-        self.v1_x = 0.0          # P1 velocity X component
-        self.v1_y = 0.0          # P1 velocity Y component
-        self.v2_magnitude = 0.0  # P2 velocity magnitude (ft/s)
-        self.v2_x = 0.0          # P2 velocity X component
-        self.v2_y = 0.0          # P2 velocity Y component
-        
-        # Initial calculation of X1 (and arm2 for constrained types)
+        # Velocity tracking for P1 and P2 (v = ω × r) lives in the shared
+        # state block, already zeroed when the row was claimed
+
+        # Initial calculation of X1 (and arm2 for constrained types);
+        # this also fills in the cached geometry below
         self._recalculate_x1_initial()
-    
+
+    def _recompute_cached_geom(self):
+        """
+        Cache trig quantities that only change when the arm sliders move.
+
+        update() runs every frame for every diagram, but the gray/gold arm
+        angles are fixed and the arm lengths only change on slider input,
+        so these are computed once here instead of per frame.
+        """
+        row = LeverDiagram._state[self._idx]
+        row[_COL_GRAY_LEN] = self.arm1_length / LeverDiagram.COS_GRAY
+        row[_COL_GRAY_RAD] = LeverDiagram.GRAY_RAD_BASE
+        # Gold arm rest angle; the horizontal diagram (D2) lies along the
+        # x axis, so its base angle is zero
+        if self.diagram_type == 2:
+            row[_COL_GOLD_RAD] = 0.0
+        else:
+            row[_COL_GOLD_RAD] = LeverDiagram.GOLD_BASE_RAD
+
+        # Distance from pivot to P2 (for v = omega * r).  For the L-shape
+        # this used to be sqrt((arm2*cos)^2 + (arm2*sin)^2), which is just
+        # arm2_length - the same as the straight-arm diagrams.
+        row[_COL_P2R] = self.arm2_length
+
     def _recalculate_x1_initial(self, x1_target=None):
         """
         Recalculate initial X1 based on current arm2_length.
@@ -272,8 +421,7 @@ class LeverDiagram:
                        The arm2_length will be calculated to make X1 = x1_target.
         """
         # Gold arm base angle = 50° from horizontal
-        gold_base_angle = (180 - self.gray_angle) - 90  # = 50°
-        cos_gold = math.cos(math.radians(gold_base_angle))
+        cos_gold = LeverDiagram.COS_GOLD
         
         if self.diagram_type == 2:
             # D2: horizontal arm, X1 equals arm2 length directly
@@ -290,8 +438,9 @@ class LeverDiagram:
             # D1a (type 1) and D3a (type 3): arm at 50° from horizontal
             # X1 = horizontal projection of arm2_length
             self.x1_initial = self.arm2_length * cos_gold
-        
+
         self.x1_current = self.x1_initial
+        self._recompute_cached_geom()
     
     def set_arm_lengths(self, arm1_length, arm2_length):
         """
@@ -300,8 +449,13 @@ class LeverDiagram:
         For X1-constrained diagrams (D1b, D3b), the arm2 slider value is used
         as the X1 target, and arm2_length is calculated to achieve that X1.
         """
+        if (arm1_length, arm2_length) == self._last_arm_args:
+            return
+        self._last_arm_args = (arm1_length, arm2_length)
+        LeverDiagram._dirty = True
+
         self.arm1_length = arm1_length
-        
+
         if self.x1_constrained:
             # For b-variants: arm2 slider value = desired X1 initial
             # arm2_length is calculated in _recalculate_x1_initial()
@@ -312,111 +466,151 @@ class LeverDiagram:
             self._recalculate_x1_initial()
     
     def set_f1(self, f1):
-        self.f1 = f1
-    
+        if f1 != self.f1:
+            self.f1 = f1
+            LeverDiagram._dirty = True
+
     def reset(self):
         """Reset physics state (rotation, velocity). Arm lengths are handled by sliders."""
         self.rotation = 0.0
         self.angular_velocity = 0.0
         # Reset x1_current to x1_initial (arm lengths already set via set_arm_lengths)
         self.x1_current = self.x1_initial
-    
-    def update(self, dt, simulating):
-        """Update physics simulation."""
-        rot = math.radians(self.rotation)
-        
-        # X1 = horizontal distance from pivot to P2
-        # As system rotates, X1 changes based on the initial angle
-        self.x1_current = self.x1_initial * math.cos(rot)
-        self.x1_current = max(0.1, abs(self.x1_current))
-        
-        # F2 = force at P2 from lever mechanics: F2 = (F1 * C) / X1
-        # Use arm1_length (horizontal distance to P1) instead of C_DISTANCE
-        self.f2_result = (self.f1 * self.arm1_length) / self.x1_current
-        
-        if not simulating:
-            self.net_torque = 0
-            # Keep velocity values visible when paused (don't zero them out)
-            # This lets the user see the last velocity state
+        LeverDiagram._dirty = True
+
+    @classmethod
+    def step_all(cls, dt, simulating):
+        """
+        Step the physics of every lever in one vectorized pass.
+
+        While paused the derived values only change when an input does, so
+        the step is skipped entirely until something marks the state dirty.
+        """
+        if simulating:
+            # Keep the flag set so the first paused frame still refreshes
+            cls._dirty = True
+        elif not cls._dirty:
             return
-        
-        # Physics simulation
-        # C_current: horizontal distance from pivot to P1 (where F1 pushes down)
-        # Uses arm1_length which represents the horizontal projection at rest
-        c_current = self.arm1_length * math.cos(rot)
-        c_current = max(0.1, abs(c_current))
-        
-        # Torques:
-        # - F1 pushes DOWN on P1 (left side) -> tries to tip left (CCW rotation)
-        # - 300lb weight pulls DOWN on P2 (right side) -> tries to tip right (CW rotation)
-        # - We need F1 to counterbalance the weight
-        
-        torque_f1 = self.f1 * c_current  # CCW (positive) - lifts right side
-        torque_weight = WEIGHT * self.x1_current  # CW (negative) - pulls right side down
-        
-        # Net torque: positive = CCW (left tips down), negative = CW (right tips down)
-        self.net_torque = torque_f1 - torque_weight
-        
-        accel = self.net_torque / MOMENT_OF_INERTIA
-        self.angular_velocity += accel * dt
-        self.angular_velocity *= (1 - ANGULAR_DAMPING * dt)
-        self.rotation += self.angular_velocity * dt
-        self.rotation = max(-MAX_ROTATION, min(MAX_ROTATION, self.rotation))
-        
-        # Calculate velocities for P1 and P2
-        # v = ω × r where ω is in rad/s and r is distance from pivot in ft
-        omega = math.radians(self.angular_velocity)  # Convert deg/s to rad/s
-        
-        # P1 velocity: gray arm length from pivot
-        gray_length = self.arm1_length / math.cos(math.radians(self.gray_angle))
-        self.v1_magnitude = abs(omega * gray_length)
-        
-        # P1 velocity direction is perpendicular to gray arm
-        gray_rad = math.radians(180 - self.gray_angle) + rot
-        # Perpendicular direction (90° rotated, sign depends on angular velocity direction)
-        if self.angular_velocity >= 0:
-            perp_angle = gray_rad + math.pi / 2
-        else:
-            perp_angle = gray_rad - math.pi / 2
-        self.v1_x = self.v1_magnitude * math.cos(perp_angle)
-        self.v1_y = -self.v1_magnitude * math.sin(perp_angle)  # Flip for screen coords
-        
-        # P2 velocity: depends on diagram type
-        # Types 4 and 5 behave like types 1 and 3 respectively
-        effective_type = self.diagram_type
-        if effective_type == 4:
-            effective_type = 1  # D1b behaves like D1a
-        elif effective_type == 5:
-            effective_type = 3  # D3b behaves like D3a
-        
-        if effective_type == 1:
-            # D1a/D1b: P2 is at the end of the L-shape, compute effective radius
-            gold_base_angle = (180 - self.gray_angle) - 90
-            rest_bend_x = self.arm2_length * math.cos(math.radians(gold_base_angle))
-            rest_bend_y = self.arm2_length * math.sin(math.radians(gold_base_angle))
-            # P2 is directly below bend at pivot Y level
-            p2_radius = math.sqrt(rest_bend_x**2 + 0**2)  # rest_p2_y = 0 relative to pivot
-            # Actually need full distance from pivot to P2
-            p2_radius = math.sqrt(rest_bend_x**2 + rest_bend_y**2)
-        else:
-            # D2 and D3a/D3b: P2 is at end of arm2
-            p2_radius = self.arm2_length
-        
-        self.v2_magnitude = abs(omega * p2_radius)
-        
-        # P2 velocity direction perpendicular to line from pivot to P2
-        if effective_type == 2:
-            gold_rad = rot  # Horizontal at rest
-        else:
-            gold_base_angle = (180 - self.gray_angle) - 90
-            gold_rad = math.radians(gold_base_angle) + rot
-        
-        if self.angular_velocity >= 0:
-            perp_angle = gold_rad + math.pi / 2
-        else:
-            perp_angle = gold_rad - math.pi / 2
-        self.v2_x = self.v2_magnitude * math.cos(perp_angle)
-        self.v2_y = -self.v2_magnitude * math.sin(perp_angle)
+        _step_all_kernel(cls._state, dt, simulating)
+        if not simulating:
+            cls._dirty = False
+
+    # --- Views into the shared state block ---
+
+    @property
+    def rotation(self):
+        return LeverDiagram._state[self._idx, _COL_ROT]
+
+    @rotation.setter
+    def rotation(self, value):
+        LeverDiagram._state[self._idx, _COL_ROT] = value
+
+    @property
+    def angular_velocity(self):
+        return LeverDiagram._state[self._idx, _COL_AVEL]
+
+    @angular_velocity.setter
+    def angular_velocity(self, value):
+        LeverDiagram._state[self._idx, _COL_AVEL] = value
+
+    @property
+    def x1_initial(self):
+        return LeverDiagram._state[self._idx, _COL_X1_INIT]
+
+    @x1_initial.setter
+    def x1_initial(self, value):
+        LeverDiagram._state[self._idx, _COL_X1_INIT] = value
+
+    @property
+    def x1_current(self):
+        return LeverDiagram._state[self._idx, _COL_X1_CUR]
+
+    @x1_current.setter
+    def x1_current(self, value):
+        LeverDiagram._state[self._idx, _COL_X1_CUR] = value
+
+    @property
+    def arm1_length(self):
+        return LeverDiagram._state[self._idx, _COL_ARM1]
+
+    @arm1_length.setter
+    def arm1_length(self, value):
+        LeverDiagram._state[self._idx, _COL_ARM1] = value
+
+    @property
+    def arm2_length(self):
+        return LeverDiagram._state[self._idx, _COL_ARM2]
+
+    @arm2_length.setter
+    def arm2_length(self, value):
+        LeverDiagram._state[self._idx, _COL_ARM2] = value
+
+    @property
+    def f1(self):
+        return LeverDiagram._state[self._idx, _COL_F1]
+
+    @f1.setter
+    def f1(self, value):
+        LeverDiagram._state[self._idx, _COL_F1] = value
+
+    @property
+    def f2_result(self):
+        return LeverDiagram._state[self._idx, _COL_F2]
+
+    @f2_result.setter
+    def f2_result(self, value):
+        LeverDiagram._state[self._idx, _COL_F2] = value
+
+    @property
+    def net_torque(self):
+        return LeverDiagram._state[self._idx, _COL_NTORQ]
+
+    @net_torque.setter
+    def net_torque(self, value):
+        LeverDiagram._state[self._idx, _COL_NTORQ] = value
+
+    @property
+    def v1_magnitude(self):
+        return LeverDiagram._state[self._idx, _COL_V1M]
+
+    @property
+    def v1_x(self):
+        return LeverDiagram._state[self._idx, _COL_V1X]
+
+    @property
+    def v1_y(self):
+        return LeverDiagram._state[self._idx, _COL_V1Y]
+
+    @property
+    def v2_magnitude(self):
+        return LeverDiagram._state[self._idx, _COL_V2M]
+
+    @property
+    def v2_x(self):
+        return LeverDiagram._state[self._idx, _COL_V2X]
+
+    @property
+    def v2_y(self):
+        return LeverDiagram._state[self._idx, _COL_V2Y]
+
+def _rotate_pt(px, py, cx, cy, c, s):
+    """Rotate a point around (cx, cy) given precomputed cos/sin (screen coords)."""
+    dx, dy = px - cx, py - cy
+    return cx + dx * c + dy * s, cy - dx * s + dy * c
+
+
+def _unit(dx, dy):
+    """Normalize a direction vector; returns (0, 0) for zero length."""
+    length = math.hypot(dx, dy)
+    return (dx / length, dy / length) if length else (0.0, 0.0)
+
+
+# Arrow-head offset patterns for the vertical force arrows, relative to the
+# arrow tip (head size 12, half-width 4.8). The geometry never changes, so
+# the three points are precomputed instead of rebuilt per call.
+_ARROW_HEAD_DOWN = ((0.0, 0.0), (-4.8, -12.0), (4.8, -12.0))
+_ARROW_HEAD_UP = ((0.0, 0.0), (4.8, 12.0), (-4.8, 12.0))
+
 
 # ==============================================================================
 # MAIN SIMULATION
@@ -425,9 +619,19 @@ class LeverDiagram:
 class Simulation:
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT),
+                                              pygame.DOUBLEBUF)
         pygame.display.set_caption("Lever Physics Simulation")
         self.clock = pygame.time.Clock()
+
+        # Drop uninteresting events at the SDL level so they never reach
+        # the Python event loop; MOUSEMOTION stays allowed because the
+        # sliders track drags through it
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN,
+                                  pygame.MOUSEBUTTONDOWN,
+                                  pygame.MOUSEBUTTONUP,
+                                  pygame.MOUSEMOTION])
         
         # Fonts
         try:
@@ -443,6 +647,10 @@ class Simulation:
         
         self.running = True
         self.simulating = False
+        self._build_text_cache()
+        # Memoized rotated-label surfaces for draw_rotated_text, keyed on
+        # (text, color, 2-degree angle bucket); see that method
+        self._rot_cache = {}
         
         # Create diagrams - 5 total:
         # D1a (type 1): Original L-shape
@@ -456,7 +664,22 @@ class Simulation:
         self.d3a = LeverDiagram(3, "Diagram 3a")
         self.d3b = LeverDiagram(5, "Diagram 3b")
         self.diagrams = [self.d1a, self.d1b, self.d2, self.d3a, self.d3b]
-        
+
+        # Titles never change - render them once per diagram; subtitles
+        # follow x1_initial, so they are re-rendered only when it moves
+        for d in self.diagrams:
+            d._title_surf = self.font_lg.render(d.name, True, COLORS['text']).convert_alpha()
+            d._subtitle_str = None
+            d._subtitle_surf = None
+            # Force labels show whole pounds, so they only need a fresh
+            # render when the integer value changes: (int value, surface)
+            d._f1_label_cache = (None, None)
+            d._f2_label_cache = (None, None)
+            # Velocity table composited once onto a small surface and
+            # re-drawn only when its formatted values change
+            d._vtable_surf = pygame.Surface((180, 56), pygame.SRCALPHA).convert_alpha()
+            d._vtable_key = None
+
         # F1 Slider (center)
         self.f1_slider = Slider(
             WINDOW_WIDTH // 2 - 125, WINDOW_HEIGHT - 100, 200, 16,
@@ -487,7 +710,38 @@ class Simulation:
                                 "▶ START", COLORS['button_start'], self.font_md)
         self.btn_reset = Button(cx + 20, WINDOW_HEIGHT - 55, 140, 40,
                                 "↺ RESET", COLORS['button_reset'], self.font_md)
-    
+        # Last simulating state pushed to the start button, so its text
+        # and color are only rewritten on an actual transition
+        self._btn_start_state = None
+
+        # Static panel layout: center X position for each of the 5 diagrams
+        self.diagram_centers = [
+            WINDOW_WIDTH // 10 + 5,          # D1a center
+            3 * WINDOW_WIDTH // 10 + 5,      # D1b center
+            WINDOW_WIDTH // 2,               # D2 center
+            7 * WINDOW_WIDTH // 10 - 5,      # D3a center
+            9 * WINDOW_WIDTH // 10 - 5,      # D3b center
+        ]
+
+        # Background layer (fill + panel rects + reference lines); only
+        # rebuilt when the F2 grouping changes the panel colors
+        self._bg_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._last_panel_colors = None
+
+    def _rebuild_background(self, panel_colors):
+        """Redraw the static background: fill, panel rects, reference lines."""
+        surf = self._bg_surface
+        surf.fill(COLORS['bg'])
+        pw = WINDOW_WIDTH // 5 - 12
+        ph = WINDOW_HEIGHT - 200
+        for i in range(5):
+            px = 10 + i * (pw + 10)
+            pygame.draw.rect(surf, panel_colors[i], (px, 90, pw, ph), border_radius=10)
+        # Horizontal reference line (Y=0) for each diagram
+        for cx in self.diagram_centers:
+            pygame.draw.line(surf, COLORS['grid'], (cx - 190, 350), (cx + 170, 350), 2)
+        self._last_panel_colors = panel_colors
+
     def _update_forces(self):
         """Update F1 force on all diagrams from slider value."""
         f1 = self.f1_slider.get_value()
@@ -508,32 +762,28 @@ class Simulation:
         Returns a list of colors for each diagram panel.
         """
         # Get F2 values for all diagrams
-        f2_values = [d.f2_result for d in self.diagrams]
-        
-        # Assign group IDs - diagrams with similar F2 get same group
-        group_ids = [-1] * len(f2_values)
-        current_group = 0
-        
-        for i in range(len(f2_values)):
-            if group_ids[i] == -1:
-                # Start a new group with this diagram
-                group_ids[i] = current_group
-                
-                # Find all other diagrams that match this F2 value
-                for j in range(i + 1, len(f2_values)):
-                    if group_ids[j] == -1:
-                        if abs(f2_values[i] - f2_values[j]) <= F2_MATCH_TOLERANCE:
-                            group_ids[j] = current_group
-                
-                current_group += 1
-        
-        # Map group IDs to colors (cycle through available colors if needed)
-        panel_colors = []
-        for gid in group_ids:
-            color_idx = gid % len(PANEL_GROUP_COLORS)
-            panel_colors.append(PANEL_GROUP_COLORS[color_idx])
-        
-        return panel_colors
+        n = len(self.diagrams)
+        f2 = np.fromiter((d.f2_result for d in self.diagrams),
+                         dtype=np.float64, count=n)
+
+        # Greedy founder grouping over the pairwise tolerance matrix: each
+        # still-unassigned diagram founds the next group and pulls in every
+        # unassigned diagram within tolerance of it. The short loop runs
+        # once per founder (at most n) and keeps the exact semantics and
+        # first-appearance group order of the original per-pair loop
+        match = np.abs(f2[:, None] - f2[None, :]) <= F2_MATCH_TOLERANCE
+        groups = np.full(n, -1)
+        gid = 0
+        for i in range(n):
+            if groups[i] < 0:
+                groups[match[i] & (groups < 0)] = gid
+                gid += 1
+
+        # Map group IDs to colors (cycle through available colors if
+        # needed); tolist() converts the numpy ints up front so the
+        # modulo and indexing below run on plain Python ints
+        n_colors = len(PANEL_GROUP_COLORS)
+        return [PANEL_GROUP_COLORS[g % n_colors] for g in groups.tolist()]
     
     def reset(self):
         """Reset simulation state and all slider values to defaults."""
@@ -552,20 +802,48 @@ class Simulation:
         for d in self.diagrams:
             d.reset()
     
-    def draw_arrow(self, surf, start, end, color, width=4):
-        pygame.draw.line(surf, color, start, end, width)
-        dx, dy = end[0] - start[0], end[1] - start[1]
-        length = math.sqrt(dx*dx + dy*dy)
-        if length < 1:
+    def _build_text_cache(self):
+        """
+        Pre-render the static labels draw_diagram blits every frame.
+
+        These strings never change, but rendering them each frame costs a
+        FreeType pass and a fresh surface per label per diagram. They are
+        rendered once here, keyed by (text, color name), and converted to
+        the display format so the per-frame blits take the fast path.
+        """
+        spec = [
+            ('P1', self.font_xs, 'f1_force'),
+            ('P2', self.font_xs, 'f2_force'),
+            ('Pivot', self.font_xs, 'pivot'),
+            ('300 lb', self.font_xs, 'text'),
+            ('Y1 = 0', self.font_xs, 'text_dim'),
+            ('90°', self.font_sm, 'angle_indicator'),
+            ('150°', self.font_sm, 'angle_indicator'),
+            ('Velocity Components', self.font_sm, 'text'),
+            ('Vx', self.font_xs, 'text_dim'),
+            ('Vy', self.font_xs, 'text_dim'),
+            ('V1:', self.font_xs, 'f1_force'),
+            ('V2:', self.font_xs, 'f2_force'),
+        ]
+        self._text_cache = {
+            (text, color_key): font.render(text, True, COLORS[color_key]).convert_alpha()
+            for text, font, color_key in spec
+        }
+
+    def draw_arrow_vert(self, surf, x, y0, y1, color, width=4):
+        """
+        Vertical arrow for the F1/F2 force arrows: the direction is
+        (0, ±1), so the normalize/perpendicular math reduces to a sign
+        and no sqrt is needed.
+        """
+        pygame.draw.line(surf, color, (x, y0), (x, y1), width)
+        if abs(y1 - y0) < 1:
             return
-        dx, dy = dx/length, dy/length
-        px, py = -dy, dx
-        hs = 12
-        p1 = (end[0] - hs*dx + hs*0.4*px, end[1] - hs*dy + hs*0.4*py)
-        p2 = (end[0] - hs*dx - hs*0.4*px, end[1] - hs*dy - hs*0.4*py)
-        pygame.draw.polygon(surf, color, [end, p1, p2])
-    
-    def draw_rotated_text(self, surf, text, font, color, center_x, center_y, angle_deg, offset_perpendicular=0):
+        offsets = _ARROW_HEAD_DOWN if y1 >= y0 else _ARROW_HEAD_UP
+        pygame.draw.polygon(surf, color,
+                            [(x + ox, y1 + oy) for ox, oy in offsets])
+
+    def draw_rotated_text(self, surf, text, font, color, center_x, center_y, angle_rad, offset_perpendicular=0):
         """
         Draw text rotated to a specific angle, centered at a position.
         
@@ -575,17 +853,25 @@ class Simulation:
             font: Font to use
             color: Text color
             center_x, center_y: Center position for the text
-            angle_deg: Rotation angle in degrees (positive = CCW)
+            angle_rad: Rotation angle in radians (positive = CCW)
             offset_perpendicular: Offset perpendicular to the text direction (positive = left of direction)
         """
-        # Render text to surface
-        text_surf = font.render(text, True, color)
-        
-        # Rotate the text surface (pygame rotates CCW for positive angles)
-        rotated_surf = pygame.transform.rotate(text_surf, angle_deg)
-        
+        # transform.rotate resamples a fresh surface every call, but the
+        # angle moves by well under a degree per frame, so rotated labels
+        # are memoized on a 2-degree bucket (degrees are only needed for
+        # pygame, so convert once)
+        bucket = round(math.degrees(angle_rad) * 0.5)
+        key = (text, color, bucket)
+        rotated_surf = self._rot_cache.get(key)
+        if rotated_surf is None:
+            text_surf = font.render(text, True, color)
+            rotated_surf = pygame.transform.rotate(text_surf, bucket * 2).convert_alpha()
+            if len(self._rot_cache) >= 256:
+                # Drop the oldest entry (dicts preserve insertion order)
+                self._rot_cache.pop(next(iter(self._rot_cache)))
+            self._rot_cache[key] = rotated_surf
+
         # Calculate perpendicular offset if needed
-        angle_rad = math.radians(angle_deg)
         perp_x = -math.sin(angle_rad) * offset_perpendicular
         perp_y = -math.cos(angle_rad) * offset_perpendicular
         
@@ -598,17 +884,8 @@ class Simulation:
     
     def draw_90_angle(self, surf, pivot, arm1_end, arm2_end, color):
         """Draw 90° indicator between two arms."""
-        dx1 = arm1_end[0] - pivot[0]
-        dy1 = arm1_end[1] - pivot[1]
-        len1 = math.sqrt(dx1*dx1 + dy1*dy1)
-        if len1 > 0:
-            dx1, dy1 = dx1/len1, dy1/len1
-        
-        dx2 = arm2_end[0] - pivot[0]
-        dy2 = arm2_end[1] - pivot[1]
-        len2 = math.sqrt(dx2*dx2 + dy2*dy2)
-        if len2 > 0:
-            dx2, dy2 = dx2/len2, dy2/len2
+        dx1, dy1 = _unit(arm1_end[0] - pivot[0], arm1_end[1] - pivot[1])
+        dx2, dy2 = _unit(arm2_end[0] - pivot[0], arm2_end[1] - pivot[1])
         
         size = 20
         corner1 = (pivot[0] + dx1 * size, pivot[1] + dy1 * size)
@@ -618,27 +895,41 @@ class Simulation:
         pygame.draw.line(surf, color, corner1, corner_mid, 3)
         pygame.draw.line(surf, color, corner2, corner_mid, 3)
     
-    def draw_diagram(self, surf, diag, cx, cy):
+    def _compute_p1_offsets(self):
+        """
+        Vectorized gray-arm endpoint offsets (pixels, relative to each
+        pivot) for all diagrams - one trig pass instead of one per panel.
+        """
+        s = LeverDiagram._state
+        gray_rad = LeverDiagram.GRAY_RAD_BASE + np.radians(s[:, _COL_ROT])
+        r = s[:, _COL_GRAY_LEN] * SCALE
+        return r * np.cos(gray_rad), -r * np.sin(gray_rad)
+
+    def draw_diagram(self, surf, diag, cx, cy, p1_dx=None, p1_dy=None):
         """Draw lever diagram with F2 value shown next to arrow."""
         rot = diag.rotation
         rot_rad = math.radians(rot)
         
         pivot_x, pivot_y = cx, cy
+        # Labels are collected and submitted as one batched blits() call
+        # at the end of the function
+        blit_list = []
         
-        # Horizontal reference line (Y=0)
+        # Horizontal reference line (Y=0) lives on the cached background
         line_y = pivot_y
-        pygame.draw.line(surf, COLORS['grid'],
-                        (cx - 190, line_y), (cx + 170, line_y), 2)
-        
+
         # ============================================================
         # GRAY ARM - uses arm1_length (horizontal projection)
         # ============================================================
-        gray_rad = math.radians(180 - diag.gray_angle) + rot_rad
-        # Calculate actual arm length from horizontal projection (arm1_length = C)
-        gray_length = diag.arm1_length / math.cos(math.radians(diag.gray_angle))
-        
-        p1_x = pivot_x + gray_length * SCALE * math.cos(gray_rad)
-        p1_y = pivot_y - gray_length * SCALE * math.sin(gray_rad)
+        gray_rad = LeverDiagram.GRAY_RAD_BASE + rot_rad
+        if p1_dx is None:
+            # Scalar fallback; run() passes the batched offsets in
+            gray_length = diag.arm1_length / LeverDiagram.COS_GRAY
+            p1_dx = gray_length * SCALE * math.cos(gray_rad)
+            p1_dy = -gray_length * SCALE * math.sin(gray_rad)
+
+        p1_x = pivot_x + p1_dx
+        p1_y = pivot_y + p1_dy
         
         pygame.draw.line(surf, COLORS['left_arm'],
                         (pivot_x, pivot_y), (p1_x, p1_y), 8)
@@ -647,23 +938,30 @@ class Simulation:
         c_mid_x = (pivot_x + p1_x) / 2
         c_mid_y = (pivot_y + p1_y) / 2
         # Gray arm angle for text rotation (convert from radians, adjust for pygame's CCW rotation)
-        gray_text_angle = math.degrees(gray_rad)
+        gray_text_angle = gray_rad
         # Offset perpendicular to arm (positive = above arm in screen coords)
         self.draw_rotated_text(surf, f"C={diag.arm1_length:.1f}ft", self.font_sm, 
                                COLORS['left_arm'], c_mid_x, c_mid_y, gray_text_angle, offset_perpendicular=15)
         
         # P1 marker
         pygame.draw.circle(surf, COLORS['f1_force'], (int(p1_x), int(p1_y)), 6)
-        p1_lbl = self.font_xs.render("P1", True, COLORS['f1_force'])
-        surf.blit(p1_lbl, (p1_x - 20, p1_y - 25))
+        # Unit direction of the gray arm, shared by the angle-label
+        # bisectors below
+        gray_ux, gray_uy = _unit(p1_x - pivot_x, p1_y - pivot_y)
+        p1_lbl = self._text_cache[('P1', 'f1_force')]
+        blit_list.append((p1_lbl, (p1_x - 20, p1_y - 25)))
         
         # F1 ARROW with value and velocity
-        self.draw_arrow(surf, (p1_x, p1_y - 10), (p1_x, p1_y + 50), COLORS['f1_force'])
-        f1_lbl = self.font_md.render(f"F1={diag.f1:.0f}", True, COLORS['f1_force'])
-        surf.blit(f1_lbl, (p1_x - 35, p1_y + 55))
+        self.draw_arrow_vert(surf, p1_x, p1_y - 10, p1_y + 50, COLORS['f1_force'])
+        f1_int = round(diag.f1)
+        f1_lbl = diag._f1_label_cache[1]
+        if f1_int != diag._f1_label_cache[0]:
+            f1_lbl = self.font_md.render(f"F1={f1_int}", True, COLORS['f1_force']).convert_alpha()
+            diag._f1_label_cache = (f1_int, f1_lbl)
+        blit_list.append((f1_lbl, (p1_x - 35, p1_y + 55)))
         # Show P1 velocity magnitude
-        v1_lbl = self.font_xs.render(f"|V1|={diag.v1_magnitude:.2f} ft/s", True, COLORS['f1_force'])
-        surf.blit(v1_lbl, (p1_x - 45, p1_y + 75))
+        v1_lbl = self.font_xs.render(f"|V1|={diag.v1_magnitude:.2f} ft/s", True, COLORS['f1_force']).convert_alpha()
+        blit_list.append((v1_lbl, (p1_x - 45, p1_y + 75)))
         
         # ============================================================
         # GOLD ARM - RIGIDLY LOCKED TO GRAY ARM
@@ -687,22 +985,17 @@ class Simulation:
             # P2 ends at Y = 0 (pivot level)
             
             # First segment uses arm2_length (slider-controlled for D1a, calculated for D1b)
-            gold_base_angle = (180 - diag.gray_angle) - 90  # = 50° from horizontal
-            
-            # At rest positions (before rotation)
-            rest_bend_x = pivot_x + diag.arm2_length * SCALE * math.cos(math.radians(gold_base_angle))
-            rest_bend_y = pivot_y - diag.arm2_length * SCALE * math.sin(math.radians(gold_base_angle))
+            # At rest positions (before rotation); 50° from horizontal
+            rest_bend_x = pivot_x + diag.arm2_length * SCALE * LeverDiagram.COS_GOLD
+            rest_bend_y = pivot_y - diag.arm2_length * SCALE * LeverDiagram.SIN_GOLD
             rest_p2_x = rest_bend_x  # P2 is directly below bend
             rest_p2_y = pivot_y      # P2 at Y=0 (pivot level)
-            
-            # Rotate both points around pivot as one rigid body
-            def rotate_pt(px, py, cx, cy, angle):
-                dx, dy = px - cx, py - cy
-                c, s = math.cos(angle), math.sin(angle)
-                return cx + dx*c + dy*s, cy - dx*s + dy*c
-            
-            bend_x, bend_y = rotate_pt(rest_bend_x, rest_bend_y, pivot_x, pivot_y, rot_rad)
-            p2_x, p2_y = rotate_pt(rest_p2_x, rest_p2_y, pivot_x, pivot_y, rot_rad)
+
+            # Rotate both points around pivot as one rigid body, sharing
+            # one cos/sin evaluation
+            c, s = math.cos(rot_rad), math.sin(rot_rad)
+            bend_x, bend_y = _rotate_pt(rest_bend_x, rest_bend_y, pivot_x, pivot_y, c, s)
+            p2_x, p2_y = _rotate_pt(rest_p2_x, rest_p2_y, pivot_x, pivot_y, c, s)
             
             pygame.draw.line(surf, COLORS['right_arm'],
                            (pivot_x, pivot_y), (bend_x, bend_y), 8)
@@ -712,24 +1005,17 @@ class Simulation:
             
             # 90° angle label at center of angle (between gray and gold arms)
             # Bisector direction between gray arm and gold arm
-            gray_dir_x = (p1_x - pivot_x)
-            gray_dir_y = (p1_y - pivot_y)
-            gold_dir_x = (bend_x - pivot_x)
-            gold_dir_y = (bend_y - pivot_y)
-            # Normalize and average
-            gray_len = math.sqrt(gray_dir_x**2 + gray_dir_y**2)
-            gold_len = math.sqrt(gold_dir_x**2 + gold_dir_y**2)
-            bisect_x = (gray_dir_x/gray_len + gold_dir_x/gold_len) / 2
-            bisect_y = (gray_dir_y/gray_len + gold_dir_y/gold_len) / 2
-            ninety_lbl = self.font_sm.render("90°", True, COLORS['angle_indicator'])
-            surf.blit(ninety_lbl, (pivot_x + bisect_x * 45 - 12, pivot_y + bisect_y * 45 - 8))
+            gold_ux, gold_uy = _unit(bend_x - pivot_x, bend_y - pivot_y)
+            bisect_x = (gray_ux + gold_ux) / 2
+            bisect_y = (gray_uy + gold_uy) / 2
+            ninety_lbl = self._text_cache[('90°', 'angle_indicator')]
+            blit_list.append((ninety_lbl, (pivot_x + bisect_x * 45 - 12, pivot_y + bisect_y * 45 - 8)))
             
         elif visual_type == 2:
             # D2: Straight horizontal arm at rest, rigidly attached
             # At rest, gold arm points to the right (0°)
             # Angle between grey (150°) and gold (0°) = 150° - LOCKED
-            gold_base_angle = 0  # horizontal at rest
-            gold_rad = math.radians(gold_base_angle) + rot_rad
+            gold_rad = rot_rad  # horizontal at rest
             
             # P2 position - horizontal arm uses arm2_length (adjustable)
             p2_x = pivot_x + diag.arm2_length * SCALE * math.cos(gold_rad)
@@ -739,22 +1025,16 @@ class Simulation:
                            (pivot_x, pivot_y), (p2_x, p2_y), 8)
             
             # 150° angle label at center of angle (between gray and gold arms)
-            gray_dir_x = (p1_x - pivot_x)
-            gray_dir_y = (p1_y - pivot_y)
-            gold_dir_x = (p2_x - pivot_x)
-            gold_dir_y = (p2_y - pivot_y)
-            gray_len = math.sqrt(gray_dir_x**2 + gray_dir_y**2)
-            gold_len = math.sqrt(gold_dir_x**2 + gold_dir_y**2)
-            bisect_x = (gray_dir_x/gray_len + gold_dir_x/gold_len) / 2
-            bisect_y = (gray_dir_y/gray_len + gold_dir_y/gold_len) / 2
-            angle_lbl = self.font_sm.render("150°", True, COLORS['angle_indicator'])
-            surf.blit(angle_lbl, (pivot_x + bisect_x * 50 - 15, pivot_y + bisect_y * 50 - 8))
+            gold_ux, gold_uy = _unit(p2_x - pivot_x, p2_y - pivot_y)
+            bisect_x = (gray_ux + gold_ux) / 2
+            bisect_y = (gray_uy + gold_uy) / 2
+            angle_lbl = self._text_cache[('150°', 'angle_indicator')]
+            blit_list.append((angle_lbl, (pivot_x + bisect_x * 50 - 15, pivot_y + bisect_y * 50 - 8)))
             
         else:
             # D3a/D3b: Same as D1's first segment (90° to gray), but NO drop
             # P2 stays elevated, arm uses arm2_length (slider for D3a, calculated for D3b)
-            gold_base_angle = (180 - diag.gray_angle) - 90  # = 50° from horizontal
-            gold_rad = math.radians(gold_base_angle) + rot_rad
+            gold_rad = LeverDiagram.GOLD_BASE_RAD + rot_rad  # = 50° from horizontal
             
             # P2 position - arm uses arm2_length
             arm_len = diag.arm2_length * SCALE
@@ -765,16 +1045,11 @@ class Simulation:
                            (pivot_x, pivot_y), (p2_x, p2_y), 8)
             
             # 90° angle label at center of angle (between gray and gold arms)
-            gray_dir_x = (p1_x - pivot_x)
-            gray_dir_y = (p1_y - pivot_y)
-            gold_dir_x = (p2_x - pivot_x)
-            gold_dir_y = (p2_y - pivot_y)
-            gray_len = math.sqrt(gray_dir_x**2 + gray_dir_y**2)
-            gold_len = math.sqrt(gold_dir_x**2 + gold_dir_y**2)
-            bisect_x = (gray_dir_x/gray_len + gold_dir_x/gold_len) / 2
-            bisect_y = (gray_dir_y/gray_len + gold_dir_y/gold_len) / 2
-            ninety_lbl = self.font_sm.render("90°", True, COLORS['angle_indicator'])
-            surf.blit(ninety_lbl, (pivot_x + bisect_x * 45 - 12, pivot_y + bisect_y * 45 - 8))
+            gold_ux, gold_uy = _unit(p2_x - pivot_x, p2_y - pivot_y)
+            bisect_x = (gray_ux + gold_ux) / 2
+            bisect_y = (gray_uy + gold_uy) / 2
+            ninety_lbl = self._text_cache[('90°', 'angle_indicator')]
+            blit_list.append((ninety_lbl, (pivot_x + bisect_x * 45 - 12, pivot_y + bisect_y * 45 - 8)))
         
         # Arm length label - rotated along the gold arm, centered on it
         # For visual_type 1 (L-shape), label goes on first segment (pivot to bend)
@@ -784,13 +1059,13 @@ class Simulation:
             gold_mid_x = (pivot_x + bend_x) / 2
             gold_mid_y = (pivot_y + bend_y) / 2
             # Calculate angle from pivot to bend
-            gold_text_angle = math.degrees(math.atan2(pivot_y - bend_y, bend_x - pivot_x))
+            gold_text_angle = math.atan2(pivot_y - bend_y, bend_x - pivot_x)
         else:
             # D2 and D3: label on arm (pivot to p2)
             gold_mid_x = (pivot_x + p2_x) / 2
             gold_mid_y = (pivot_y + p2_y) / 2
             # Calculate angle from pivot to p2
-            gold_text_angle = math.degrees(math.atan2(pivot_y - p2_y, p2_x - pivot_x))
+            gold_text_angle = math.atan2(pivot_y - p2_y, p2_x - pivot_x)
         
         # Format label text based on whether arm2 is calculated or set
         if diag.x1_constrained:
@@ -807,19 +1082,24 @@ class Simulation:
         # ============================================================
         
         pygame.draw.circle(surf, COLORS['f2_force'], (int(p2_x), int(p2_y)), 6)
-        p2_lbl = self.font_xs.render("P2", True, COLORS['f2_force'])
-        surf.blit(p2_lbl, (p2_x + 10, p2_y - 20))
+        p2_lbl = self._text_cache[('P2', 'f2_force')]
+        blit_list.append((p2_lbl, (p2_x + 10, p2_y - 20)))
         
         # F2 ARROW with VALUE shown next to it!
         f2_len = 50 + min(diag.f2_result / 5, 30)
-        self.draw_arrow(surf, (p2_x, p2_y + 5), (p2_x, p2_y - f2_len), COLORS['f2_force'])
-        
-        # F2 value label RIGHT NEXT TO the arrow
-        f2_val_lbl = self.font_md.render(f"F2={diag.f2_result:.0f}", True, COLORS['f2_force'])
-        surf.blit(f2_val_lbl, (p2_x + 15, p2_y - f2_len + 10))
+        self.draw_arrow_vert(surf, p2_x, p2_y + 5, p2_y - f2_len, COLORS['f2_force'])
+        
+        # F2 value label RIGHT NEXT TO the arrow - cached on the rounded
+        # value, which only moves every few frames during animation
+        f2_int = round(diag.f2_result)
+        f2_val_lbl = diag._f2_label_cache[1]
+        if f2_int != diag._f2_label_cache[0]:
+            f2_val_lbl = self.font_md.render(f"F2={f2_int}", True, COLORS['f2_force']).convert_alpha()
+            diag._f2_label_cache = (f2_int, f2_val_lbl)
+        blit_list.append((f2_val_lbl, (p2_x + 15, p2_y - f2_len + 10)))
         # Show P2 velocity magnitude
-        v2_lbl = self.font_xs.render(f"|V2|={diag.v2_magnitude:.2f} ft/s", True, COLORS['f2_force'])
-        surf.blit(v2_lbl, (p2_x + 15, p2_y - f2_len + 30))
+        v2_lbl = self.font_xs.render(f"|V2|={diag.v2_magnitude:.2f} ft/s", True, COLORS['f2_force']).convert_alpha()
+        blit_list.append((v2_lbl, (p2_x + 15, p2_y - f2_len + 30)))
         
         # Weight (longer rope to reduce clutter)
         rope_len = 128
@@ -833,8 +1113,8 @@ class Simulation:
         pygame.draw.polygon(surf, COLORS['weight_outline'], pts, 2)
         pygame.draw.circle(surf, COLORS['weight_outline'], (int(p2_x), int(wt_top)), 4, 2)
         
-        wt_lbl = self.font_xs.render("300 lb", True, COLORS['text'])
-        surf.blit(wt_lbl, (p2_x - 20, wt_top + wh/2 - 6))
+        wt_lbl = self._text_cache[('300 lb', 'text')]
+        blit_list.append((wt_lbl, (p2_x - 20, wt_top + wh/2 - 6)))
         
         # ============================================================
         # X1 dimension
@@ -849,8 +1129,8 @@ class Simulation:
         pygame.draw.line(surf, COLORS['moment_arm'],
                         (pivot_x + x1_pixels, dim_y - 5), (pivot_x + x1_pixels, dim_y + 5), 2)
         
-        x1_lbl = self.font_sm.render(f"X1 = {diag.x1_current:.2f} ft", True, COLORS['moment_arm'])
-        surf.blit(x1_lbl, (pivot_x + x1_pixels/2 - 35, dim_y + 8))
+        x1_lbl = self.font_sm.render(f"X1 = {diag.x1_current:.2f} ft", True, COLORS['moment_arm']).convert_alpha()
+        blit_list.append((x1_lbl, (pivot_x + x1_pixels/2 - 35, dim_y + 8)))
         
         # Y1 indicator for D3a/D3b (visual_type 3)
         if visual_type == 3:
@@ -862,30 +1142,37 @@ class Simulation:
                                (p2_x + 25, pivot_y), (p2_x + 35, pivot_y), 2)
                 pygame.draw.line(surf, COLORS['y1_dim'],
                                (p2_x + 25, p2_y), (p2_x + 35, p2_y), 2)
-                y1_lbl = self.font_xs.render(f"Y1 = {y1_val:.1f} ft", True, COLORS['y1_dim'])
-                surf.blit(y1_lbl, (p2_x + 40, (pivot_y + p2_y)/2 - 8))
+                y1_lbl = self.font_xs.render(f"Y1 = {y1_val:.1f} ft", True, COLORS['y1_dim']).convert_alpha()
+                blit_list.append((y1_lbl, (p2_x + 40, (pivot_y + p2_y)/2 - 8)))
         else:
-            y1_lbl = self.font_xs.render("Y1 = 0", True, COLORS['text_dim'])
-            surf.blit(y1_lbl, (p2_x + 20, pivot_y + 5))
+            y1_lbl = self._text_cache[('Y1 = 0', 'text_dim')]
+            blit_list.append((y1_lbl, (p2_x + 20, pivot_y + 5)))
         
         # ============================================================
         # Pivot
         # ============================================================
         pygame.draw.circle(surf, COLORS['pivot'], (int(pivot_x), int(pivot_y)), 12)
         pygame.draw.circle(surf, COLORS['bg'], (int(pivot_x), int(pivot_y)), 5)
-        piv_lbl = self.font_xs.render("Pivot", True, COLORS['pivot'])
-        surf.blit(piv_lbl, (pivot_x - 35, pivot_y + 18))
+        piv_lbl = self._text_cache[('Pivot', 'pivot')]
+        blit_list.append((piv_lbl, (pivot_x - 35, pivot_y + 18)))
         
-        # Title
-        title = self.font_lg.render(diag.name, True, COLORS['text'])
-        surf.blit(title, (cx - title.get_width()//2, cy - 240))
-        
-        # Subtitle explaining the variant - positioned closer to title
+        # Title (pre-rendered)
+        title = diag._title_surf
+        blit_list.append((title, (cx - title.get_width()//2, cy - 240)))
+
+        # Subtitle explaining the variant - positioned closer to title;
+        # re-rendered only when x1_initial changes the string
         if diag.x1_constrained:
-            subtitle = self.font_xs.render(f"X1={diag.x1_initial:.2f} ft (C calc'd)", True, COLORS['moment_arm'])
+            sub_str = f"X1={diag.x1_initial:.2f} ft (C calc'd)"
+            sub_color = 'moment_arm'
         else:
-            subtitle = self.font_xs.render(f"X1={diag.x1_initial:.2f} ft", True, COLORS['text_dim'])
-        surf.blit(subtitle, (cx - subtitle.get_width()//2, cy - 220))
+            sub_str = f"X1={diag.x1_initial:.2f} ft"
+            sub_color = 'text_dim'
+        if sub_str != diag._subtitle_str:
+            diag._subtitle_surf = self.font_xs.render(sub_str, True, COLORS[sub_color]).convert_alpha()
+            diag._subtitle_str = sub_str
+        subtitle = diag._subtitle_surf
+        blit_list.append((subtitle, (cx - subtitle.get_width()//2, cy - 220)))
         
         # ============================================================
         # Velocity Component Table - below diagram
@@ -894,51 +1181,54 @@ class Simulation:
         table_x = cx - 90   # Center the table
         
         # Angular velocity display (ω)
-        omega_lbl = self.font_sm.render(f"ω = {diag.angular_velocity:.2f} °/s", True, COLORS['pivot'])
-        surf.blit(omega_lbl, (table_x + 35, table_y - 38))
+        omega_lbl = self.font_sm.render(f"ω = {diag.angular_velocity:.2f} °/s", True, COLORS['pivot']).convert_alpha()
+        blit_list.append((omega_lbl, (table_x + 35, table_y - 38)))
         
         # Table header
-        hdr = self.font_sm.render("Velocity Components", True, COLORS['text'])
-        surf.blit(hdr, (table_x + 10, table_y - 20))
-        
-        # Draw table background
-        table_rect = pygame.Rect(table_x, table_y, 180, 55)
-        pygame.draw.rect(surf, COLORS['slider_bg'], table_rect, border_radius=4)
-        pygame.draw.rect(surf, COLORS['text_dim'], table_rect, 1, border_radius=4)
-        
-        # Column headers
-        col_x = self.font_xs.render("Vx", True, COLORS['text_dim'])
-        col_y = self.font_xs.render("Vy", True, COLORS['text_dim'])
-        surf.blit(col_x, (table_x + 70, table_y + 3))
-        surf.blit(col_y, (table_x + 130, table_y + 3))
-        
-        # Horizontal separator line
-        pygame.draw.line(surf, COLORS['text_dim'], 
-                        (table_x + 5, table_y + 18), (table_x + 175, table_y + 18), 1)
-        
-        # V1 row (P1 velocity)
-        v1_row = self.font_xs.render("V1:", True, COLORS['f1_force'])
-        v1_x_val = self.font_xs.render(f"{diag.v1_x:+.2f}", True, COLORS['f1_force'])
-        v1_y_val = self.font_xs.render(f"{diag.v1_y:+.2f}", True, COLORS['f1_force'])
-        surf.blit(v1_row, (table_x + 8, table_y + 22))
-        surf.blit(v1_x_val, (table_x + 55, table_y + 22))
-        surf.blit(v1_y_val, (table_x + 115, table_y + 22))
-        
-        # V2 row (P2 velocity)
-        v2_row = self.font_xs.render("V2:", True, COLORS['f2_force'])
-        v2_x_val = self.font_xs.render(f"{diag.v2_x:+.2f}", True, COLORS['f2_force'])
-        v2_y_val = self.font_xs.render(f"{diag.v2_y:+.2f}", True, COLORS['f2_force'])
-        surf.blit(v2_row, (table_x + 8, table_y + 38))
-        surf.blit(v2_x_val, (table_x + 55, table_y + 38))
-        surf.blit(v2_y_val, (table_x + 115, table_y + 38))
+        hdr = self._text_cache[('Velocity Components', 'text')]
+        blit_list.append((hdr, (table_x + 10, table_y - 20)))
+        
+        # Table body (background, rules, rows) lives on a pre-composed
+        # per-diagram surface; re-composite only when the formatted
+        # values change, otherwise a single blit per frame suffices
+        vkey = (f"{diag.v1_x:+.2f}", f"{diag.v1_y:+.2f}",
+                f"{diag.v2_x:+.2f}", f"{diag.v2_y:+.2f}")
+        if vkey != diag._vtable_key:
+            vt = diag._vtable_surf
+            vt.fill((0, 0, 0, 0))
+            body = pygame.Rect(0, 0, 180, 55)
+            pygame.draw.rect(vt, COLORS['slider_bg'], body, border_radius=4)
+            pygame.draw.rect(vt, COLORS['text_dim'], body, 1, border_radius=4)
+
+            # Column headers
+            vt.blit(self._text_cache[('Vx', 'text_dim')], (70, 3))
+            vt.blit(self._text_cache[('Vy', 'text_dim')], (130, 3))
+
+            # Horizontal separator line
+            pygame.draw.line(vt, COLORS['text_dim'], (5, 18), (175, 18), 1)
+
+            # V1 row (P1 velocity)
+            vt.blit(self._text_cache[('V1:', 'f1_force')], (8, 22))
+            vt.blit(self.font_xs.render(vkey[0], True, COLORS['f1_force']).convert_alpha(), (55, 22))
+            vt.blit(self.font_xs.render(vkey[1], True, COLORS['f1_force']).convert_alpha(), (115, 22))
+
+            # V2 row (P2 velocity)
+            vt.blit(self._text_cache[('V2:', 'f2_force')], (8, 38))
+            vt.blit(self.font_xs.render(vkey[2], True, COLORS['f2_force']).convert_alpha(), (55, 38))
+            vt.blit(self.font_xs.render(vkey[3], True, COLORS['f2_force']).convert_alpha(), (115, 38))
+            diag._vtable_key = vkey
+        blit_list.append((diag._vtable_surf, (table_x, table_y)))
+    
+
+        surf.blits(blit_list, doreturn=False)
     
     def draw_header(self):
-        t = self.font_lg.render("Lever Physics: F2 = F1 × C / X1", True, COLORS['text'])
+        t = self.font_lg.render("Lever Physics: F2 = F1 × C / X1", True, COLORS['text']).convert_alpha()
         self.screen.blit(t, (WINDOW_WIDTH//2 - t.get_width()//2, 10))
         
         s = self.font_sm.render(
             "D1a/D3a: Standard arm length | D1b/D3b: Arm calculated so X1 = 1.5 ft | D3a/D3b: Y1 ≠ 0 (elevated P2)",
-            True, COLORS['text_dim'])
+            True, COLORS['text_dim']).convert_alpha()
         self.screen.blit(s, (WINDOW_WIDTH//2 - s.get_width()//2, 42))
         
         if self.simulating:
@@ -947,16 +1237,25 @@ class Simulation:
         else:
             st = "Press START to simulate"
             c = COLORS['text_dim']
-        st_surf = self.font_md.render(st, True, c)
+        st_surf = self.font_md.render(st, True, c).convert_alpha()
         self.screen.blit(st_surf, (WINDOW_WIDTH//2 - st_surf.get_width()//2, 65))
     
     def run(self):
+        # Hoist hot attribute lookups out of the frame loop.
+        # tick_busy_loop paces frames with a busy-wait instead of SDL_Delay,
+        # whose ~15 ms granularity on some platforms causes frame jitter.
+        tick = self.clock.tick_busy_loop
+        flip = pygame.display.flip
+        get_events = pygame.event.get
+        get_mouse = pygame.mouse.get_pos
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
-            mpos = pygame.mouse.get_pos()
+            dt = tick(FPS) / 1000.0
+            mpos = get_mouse()
             clicked = False
-            
-            for e in pygame.event.get():
+            f1_changed = False
+            arms_changed = False
+
+            for e in get_events():
                 if e.type == pygame.QUIT:
                     self.running = False
                 elif e.type == pygame.KEYDOWN:
@@ -970,13 +1269,15 @@ class Simulation:
                     clicked = True
                 
                 # Handle all slider events
-                self.f1_slider.handle_event(e)
-                self.arm1_slider.handle_event(e)
-                self.arm2_slider.handle_event(e)
-            
-            # Update forces and arm lengths from slider values
-            self._update_forces()
-            self._update_arm_lengths()
+                f1_changed |= self.f1_slider.handle_event(e)
+                arms_changed |= self.arm1_slider.handle_event(e)
+                arms_changed |= self.arm2_slider.handle_event(e)
+
+            # Push slider values to the diagrams only when they changed
+            if f1_changed:
+                self._update_forces()
+            if arms_changed:
+                self._update_arm_lengths()
             
             self.btn_start.update(mpos)
             self.btn_reset.update(mpos)
@@ -987,44 +1288,32 @@ class Simulation:
             if self.btn_reset.clicked(mpos, clicked):
                 self.reset()
             
-            # Update start button text and color based on simulation state
-            if self.simulating:
-                self.btn_start.text = "⏸ STOP"
-                self.btn_start.color = COLORS['button_reset']
-            else:
-                self.btn_start.text = "▶ START"
-                self.btn_start.color = COLORS['button_start']
+            # Update start button text and color, but only on an actual
+            # start/stop transition - writing them every frame defeats
+            # the button's cached-label and hover-color checks
+            if self.simulating != self._btn_start_state:
+                if self.simulating:
+                    self.btn_start.text = "⏸ STOP"
+                    self.btn_start.color = COLORS['button_reset']
+                else:
+                    self.btn_start.text = "▶ START"
+                    self.btn_start.color = COLORS['button_start']
+                self._btn_start_state = self.simulating
             
-            # Update ALL diagrams
-            for d in self.diagrams:
-                d.update(dt, self.simulating)
+            # Update ALL diagrams in one vectorized pass
+            LeverDiagram.step_all(dt, self.simulating)
             
-            # Draw
-            self.screen.fill(COLORS['bg'])
-            
-            # Layout for 5 diagrams in a row
-            pw = WINDOW_WIDTH // 5 - 12
-            ph = WINDOW_HEIGHT - 200
-            
-            # Group diagrams by F2 value (within tolerance = same color)
-            # Assign colors dynamically based on F2 matching
+            # Draw: static layer first (fill + panels + reference lines),
+            # rebuilt only when the F2 grouping recolors the panels
             panel_colors = self._get_panel_colors_by_f2()
-            
-            # Draw panels with group-based colors
-            for i in range(5):
-                px = 10 + i * (pw + 10)
-                pygame.draw.rect(self.screen, panel_colors[i], (px, 90, pw, ph), border_radius=10)
-            
-            # Calculate center X positions for each diagram
-            centers = [
-                WINDOW_WIDTH // 10 + 5,          # D1a center
-                3 * WINDOW_WIDTH // 10 + 5,      # D1b center
-                WINDOW_WIDTH // 2,                # D2 center
-                7 * WINDOW_WIDTH // 10 - 5,      # D3a center
-                9 * WINDOW_WIDTH // 10 - 5,      # D3b center
-            ]
-            for d, cx in zip(self.diagrams, centers):
-                self.draw_diagram(self.screen, d, cx, 350)
+            if panel_colors != self._last_panel_colors:
+                self._rebuild_background(panel_colors)
+            self.screen.blit(self._bg_surface, (0, 0))
+
+            p1_dx, p1_dy = self._compute_p1_offsets()
+            for d, cx, dx, dy in zip(self.diagrams, self.diagram_centers,
+                                     p1_dx, p1_dy):
+                self.draw_diagram(self.screen, d, cx, 350, dx, dy)
             
             self.draw_header()
             
@@ -1035,14 +1324,19 @@ class Simulation:
             
             self.btn_start.draw(self.screen)
             self.btn_reset.draw(self.screen)
-            
+
+            # Flush all queued widget text in one batched call
+            self.screen.blits(_UI_BLIT_QUEUE, doreturn=False)
+            _UI_BLIT_QUEUE.clear()
+
+
             inst = self.font_xs.render(
                 "[SPACE] Toggle • [R] Reset • [ESC] Quit • Drag sliders to adjust F1 and arm lengths",
-                True, COLORS['text_dim'])
+                True, COLORS['text_dim']).convert_alpha()
             self.screen.blit(inst, (WINDOW_WIDTH//2 - inst.get_width()//2, WINDOW_HEIGHT - 15))
             
-            pygame.display.flip()
-        
+            flip()
+
         pygame.quit()
         sys.exit()
 